@@ -1,5 +1,6 @@
 import re
 import json
+import logging
 import pandas as pd
 import streamlit as st
 
@@ -17,6 +18,16 @@ from frontend.fullscreen_results import render_fullscreen_results_page, apply_fu
 
 
 st.set_page_config(page_title="TalentScope", page_icon="🎯", layout="wide", initial_sidebar_state="expanded")
+# 后端进度输出走 logging（如 Stage 2 选人汇总）：只为 backend.* logger 配置 INFO 级控制台输出，
+# 根 logger 保持默认 WARNING，第三方库（httpx、urllib3、openai、streamlit）的 INFO 日志不会刷屏；
+# 已有 handler 时跳过，Streamlit 每次重跑脚本不会重复添加
+_backend_logger = logging.getLogger("backend")
+if not _backend_logger.handlers:
+    _backend_handler = logging.StreamHandler()
+    _backend_handler.setFormatter(logging.Formatter("%(message)s"))
+    _backend_logger.addHandler(_backend_handler)
+    _backend_logger.setLevel(logging.INFO)
+    _backend_logger.propagate = False
 inject_global_css()
 
 # Session defaults
@@ -18,6 +18,7 @@ SAVE_DIR = os.path.join(os.getcwd(), "results")
 # ============================ SEARXNG CONFIG ============================
 SEARXNG_BASE_URL = os.getenv("SEARXNG_BASE_URL", "http://localhost:8888")
 SEARXNG_PAGES = 1         # Pages per query
+SEARXNG_CONCURRENCY = int(os.getenv("SEARXNG_CONCURRENCY", "6"))  # Max in-flight SearXNG requests per process
 # ========================================
 # 场景化搜索引擎配置（Scene-based Engine Configuration）
 # ========================================
@@ -276,6 +276,31 @@ def safe_get(obj, path, default=None):
             return default
     return cur
 
+def safe_get_text(obj, *keys, default: str = "") -> str:
+    """Extract LLM response text as a plain string
+
+    Tries each key in order (e.g. "content", "text") and falls back to str(obj).
+    List/dict payloads are unwrapped the same way ChatTongyi responses are:
+    [{'text': ...}] or {'text': ...} yield the inner text, other lists are joined.
+    """
+    txt = None
+    for key in keys:
+        txt = safe_get(obj, key, "")
+        if txt:
+            break
+    if not txt:
+        txt = str(obj)
+
+    if isinstance(txt, str):
+        return txt
+    if isinstance(txt, dict) and 'text' in txt:
+        return str(txt['text'])
+    if isinstance(txt, list) and len(txt) > 0:
+        if isinstance(txt[0], dict) and 'text' in txt[0]:
+            return str(txt[0]['text'])
+        return ' '.join(str(item) for item in txt)
+    return str(txt) if txt else default
+
 def safe_structured(llm: ChatOpenAI | ChatTongyi | VLLMOpenAI, prompt: str, schema_cls):
     """Safely get structured output from LLM with fallbacks"""
     import time
@@ -5,11 +5,34 @@ Handles saving and loading of reports for Achievement Report and Trend Radar mod
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import streamlit as st
 
+try:
+    # Optional: orjson parses/serializes large reports several times faster; falls back to json
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Threads used to overlap file reads when loading many reports at once
+READ_WORKERS = 8
+
+
+def _json_loads(raw):
+    """Parse report JSON from bytes or str"""
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize a report as indented UTF-8 JSON"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 class ReportStorage:
     """Centralized report storage management"""
@@ -23,6 +46,7 @@ class ReportStorage:
         self.recommend_research_group_dir = self.achievement_dir / "recommend_research_group"
         self.msra_former_interns_dir = self.achievement_dir / "msra_former_interns"
         self.starttrack_group_dir = self.achievement_dir / "starttrack_group"
+        self.achievement_manifest_path = self.achievement_dir / "manifest.json"
         
         # Trend Radar subdirectories
         self.domestic_dir = self.trend_radar_dir / "domestic"
@@ -96,8 +120,8 @@ class ReportStorage:
         # 使用临时文件确保写入的原子性，防止JSON文件损坏
         temp_filepath = filepath.with_suffix('.tmp')
         try:
-            with open(temp_filepath, 'w', encoding='utf-8') as f:
-                json.dump(report_with_metadata, f, ensure_ascii=False, indent=2)
+            with open(temp_filepath, 'wb') as f:
+                f.write(_json_dumps(report_with_metadata))
             # 原子性重命名，确保文件完整性
             temp_filepath.rename(filepath)
         except Exception as e:
@@ -106,8 +130,50 @@ class ReportStorage:
                 temp_filepath.unlink()
             raise e
         
+        self._update_achievement_manifest(group_type, report_with_metadata["created_at"])
         return str(filepath)
     
+    def _read_achievement_manifest(self) -> Dict[str, str]:
+        """Read the {group_type: latest created_at} manifest, empty if missing or corrupt"""
+        try:
+            with open(self.achievement_manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _update_achievement_manifest(self, group_type: str, created_at: str):
+        """Record the latest report timestamp for a group (atomic write)"""
+        manifest = self._read_achievement_manifest()
+        if manifest.get(group_type, "") >= created_at:
+            return
+        manifest[group_type] = created_at
+        
+        temp_filepath = self.achievement_manifest_path.with_suffix('.tmp')
+        try:
+            with open(temp_filepath, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+            os.replace(temp_filepath, self.achievement_manifest_path)
+        except OSError:
+            # The manifest is only a lookup shortcut; never fail a save over it
+            if temp_filepath.exists():
+                temp_filepath.unlink()
+    
+    def get_latest_achievement_report_time(self, group_type: str) -> str:
+        """Return the created_at of the newest report of a group ("" if none)
+        
+        Served from the manifest; groups missing from it (reports saved before the
+        manifest existed) are backfilled once from a directory scan.
+        """
+        manifest = self._read_achievement_manifest()
+        if group_type in manifest:
+            return manifest[group_type]
+        
+        reports = self.load_achievement_reports(group_type)
+        latest = reports[0].get("created_at", "") if reports else ""
+        self._update_achievement_manifest(group_type, latest)
+        return latest
+    
     def save_trend_radar_report(self, report_data: Dict[str, Any], title: str = "", 
                                report_type: str = "domestic") -> str:
         """Save trend radar report (domestic or international)"""
@@ -142,13 +208,11 @@ class ReportStorage:
         
         return str(filepath)
     
-    def load_achievement_reports(self, group_type: str = "all") -> List[Dict[str, Any]]:
-        """Load achievement reports (all groups or specific group)"""
-        reports = []
-        
+    def _achievement_search_dirs(self, group_type: str) -> List[Path]:
+        """Resolve the report directories for 'all' or a specific group type"""
         if group_type == "all":
             # Load from all group directories
-            search_dirs = [
+            return [
                 self.recommend_research_group_dir,
                 self.msra_former_interns_dir,
                 self.starttrack_group_dir
@@ -160,19 +224,85 @@ class ReportStorage:
                 "msra_former_interns": self.msra_former_interns_dir,
                 "starttrack_group": self.starttrack_group_dir
             }[group_type]
-            search_dirs = [target_dir]
+            return [target_dir]
         else:
             raise ValueError("group_type must be 'all' or one of: recommend_research_group, msra_former_interns, starttrack_group")
+    
+    def iter_achievement_reports(self, group_type: str = "all") -> Iterator[Dict[str, Any]]:
+        """Lazily yield achievement reports, most recently written file first
         
-        for directory in search_dirs:
-            for filepath in directory.glob("*.json"):
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        report = json.load(f)
-                        report["filepath"] = str(filepath)
-                        reports.append(report)
-                except Exception as e:
-                    st.warning(f"Failed to load report {filepath.name}: {e}")
+        Files are ordered by mtime and parsed one at a time, so a caller looking
+        for a recent report can stop after the first match without reading the rest.
+        """
+        entries = []
+        for directory in self._achievement_search_dirs(group_type):
+            with os.scandir(directory) as it:
+                entries.extend(e for e in it if e.name.endswith(".json") and e.is_file())
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        
+        for entry in entries:
+            try:
+                with open(entry.path, 'rb') as f:
+                    report = _json_loads(f.read())
+                report["filepath"] = entry.path
+            except Exception as e:
+                st.warning(f"Failed to load report {entry.name}: {e}")
+                continue
+            yield report
+    
+    def achievement_reports_version(self, group_type: str = "all") -> int:
+        """Cheap change marker for stored achievement reports
+        
+        Reports are only ever added (atomic rename) or deleted, both of which bump
+        the containing directory's mtime, so the newest directory mtime changes
+        whenever the set of reports does.
+        """
+        return max(d.stat().st_mtime_ns for d in self._achievement_search_dirs(group_type))
+    
+    def scan_achievement_reports(self, group_type: str = "all") -> Dict[str, int]:
+        """Map every stored achievement report file to its mtime (ns), without reading it"""
+        files = {}
+        for directory in self._achievement_search_dirs(group_type):
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        files[entry.path] = entry.stat().st_mtime_ns
+        return files
+    
+    def load_achievement_report_file(self, filepath: str) -> Dict[str, Any]:
+        """Load a single stored achievement report"""
+        with open(filepath, 'rb') as f:
+            report = _json_loads(f.read())
+        report["filepath"] = filepath
+        return report
+    
+    @staticmethod
+    def _read_files(paths: List[Path]) -> List[Any]:
+        """Read many small files with overlapping I/O; failed reads come back as the exception"""
+        def _read(path):
+            try:
+                return path.read_bytes()
+            except OSError as e:
+                return e
+        
+        if len(paths) < 2:
+            return [_read(p) for p in paths]
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(paths))) as pool:
+            return list(pool.map(_read, paths))
+    
+    def load_achievement_reports(self, group_type: str = "all") -> List[Dict[str, Any]]:
+        """Load achievement reports (all groups or specific group)"""
+        paths = [p for d in self._achievement_search_dirs(group_type) for p in d.glob("*.json")]
+        reports = []
+        for filepath, raw in zip(paths, self._read_files(paths)):
+            try:
+                if isinstance(raw, Exception):
+                    raise raw
+                report = _json_loads(raw)
+                report["filepath"] = str(filepath)
+                reports.append(report)
+            except Exception as e:
+                st.warning(f"Failed to load report {filepath.name}: {e}")
         
         # Sort by creation time (newest first)
         reports.sort(key=lambda x: x.get("created_at", ""), reverse=True)
@@ -263,11 +393,36 @@ def load_achievement_reports(group_type: str = "all") -> List[Dict[str, Any]]:
     return report_storage.load_achievement_reports(group_type)
 
 
+def achievement_reports_version(group_type: str = "all") -> int:
+    """Convenience function to get the change marker of stored achievement reports"""
+    return report_storage.achievement_reports_version(group_type)
+
+
+def scan_achievement_reports(group_type: str = "all") -> Dict[str, int]:
+    """Convenience function to list stored achievement report files with their mtimes"""
+    return report_storage.scan_achievement_reports(group_type)
+
+
+def load_achievement_report_file(filepath: str) -> Dict[str, Any]:
+    """Convenience function to load a single stored achievement report"""
+    return report_storage.load_achievement_report_file(filepath)
+
+
+def iter_achievement_reports(group_type: str = "all") -> Iterator[Dict[str, Any]]:
+    """Convenience function to lazily iterate achievement reports"""
+    return report_storage.iter_achievement_reports(group_type)
+
+
 def load_trend_radar_reports(report_type: str = "domestic") -> List[Dict[str, Any]]:
     """Convenience function to load trend radar reports"""
     return report_storage.load_trend_radar_reports(report_type)
 
 
+def get_latest_achievement_report_time(group_type: str) -> str:
+    """Convenience function to get the newest achievement report timestamp of a group"""
+    return report_storage.get_latest_achievement_report_time(group_type)
+
+
 def delete_report(filepath: str) -> bool:
     """Convenience function to delete a report"""
     return report_storage.delete_report(filepath)
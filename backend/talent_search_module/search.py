@@ -35,10 +35,19 @@ import time
 import threading
 
 _SEARX_COUNTER = 0
+# 共享 HTTP 会话：跨请求复用 TCP/TLS 连接（keep-alive），避免每次请求重新握手
+SESSION = requests.Session()
 # 全局速率限制：确保任何时候只有一个请求在发送
 _SEARX_LOCK = threading.Lock()
 _LAST_SEARX_REQUEST_TIME = 0
 _MIN_REQUEST_INTERVAL = 0.8  # 每个请求之间至少间隔 0.8 秒（避免 429 错误）
+# 进程级并发上限：多方向并发搜索时限制同时在途的 SearXNG 请求数（间隔只限制发起速率，不限制在途数量）
+_SEARX_SLOTS = threading.BoundedSemaphore(config.SEARXNG_CONCURRENCY)
+
+def set_session(session: requests.Session) -> None:
+    """替换模块共享的 HTTP 会话（例如调用方配置了连接池大小/重试策略的 Session）"""
+    global SESSION
+    SESSION = session
 
 def searxng_search(query: str, engines: List[str] = config.SEARXNG_ENGINES,
                    pages: int = config.SEARXNG_PAGES, k_per_query: int = config.SEARCH_K) -> List[Dict[str, str]]:
@@ -55,13 +64,13 @@ def searxng_search(query: str, engines: List[str] = config.SEARXNG_ENGINES,
     for p in range(1, pages + 1):
         # 速率限制：确保请求间隔
         with _SEARX_LOCK:
-            current_time = time.time()
+            current_time = time.monotonic()
             elapsed = current_time - _LAST_SEARX_REQUEST_TIME
             if elapsed < _MIN_REQUEST_INTERVAL:
                 sleep_time = _MIN_REQUEST_INTERVAL - elapsed
                 print(f"[searxng] Rate limiting: sleeping {sleep_time:.2f}s")
                 time.sleep(sleep_time)
-            _LAST_SEARX_REQUEST_TIME = time.time()
+            _LAST_SEARX_REQUEST_TIME = time.monotonic()
         
         # 重试逻辑：429 错误时自动重试
         max_retries = 3
@@ -87,7 +96,8 @@ def searxng_search(query: str, engines: List[str] = config.SEARXNG_ENGINES,
                 else:
                     print(f"[searxng] Retry {attempt}/{max_retries} for query: {query[:50]}...")
                 
-                r = requests.get(search_url, params=params, timeout=35, headers=config.UA)
+                with _SEARX_SLOTS:  # 只在请求期间占用名额，429 退避等待时不占用
+                    r = SESSION.get(search_url, params=params, timeout=35, headers=config.UA)
                 
                 print(f"[searxng] Response status: {r.status_code}, content-length: {len(r.content)}")
                 
@@ -171,13 +181,12 @@ def canonicalize_url(u: str) -> str:
 
 # ---- HTTP 获取：带重试、合理头、编码处理 ----
 def _http_get(url: str, timeout: int = 15) -> requests.Response:
-    sess = requests.Session()
     # 比默认更像浏览器，提升可达性
     headers = dict(config.UA or {})
     headers.setdefault("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
     headers.setdefault("Accept-Language", "en-US,en;q=0.9")
     headers.setdefault("Cache-Control", "no-cache")
-    r = sess.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+    r = SESSION.get(url, headers=headers, timeout=timeout, allow_redirects=True)
     # 让 requests 自动以 apparent_encoding 回填（对 text/html 有帮助）
     if not r.encoding or r.encoding.lower() == "iso-8859-1":
         r.encoding = r.apparent_encoding or r.encoding
@@ -4,12 +4,25 @@
 """
 from __future__ import annotations
 
+import heapq
+import io
+import logging
+import re
 import textwrap
+import threading
+from operator import itemgetter
 from typing import List, Dict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from backend import trend_data, llm as llm_utils
 
+logger = logging.getLogger(__name__)
+
+# Stage 3 复用的常驻线程池：避免每次生成报告都新建/销毁线程；
+# 信号量限制同时在途的 LLM 请求数，超过供应商并发上限的请求只会在 API 端排队
+_LLM_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="TrendLLM")
+_LLM_SEM = threading.Semaphore(4)
+
 # Import search module for llm_pick_urls (URL scoring)
 try:
     from backend.trend_radar_search import search as trend_search
@@ -185,6 +198,24 @@ def _build_article_lines(recent_map: Dict[str, List[Dict]]) -> str:
     return "\n".join(lines)
 
 
+# Replace common Unicode characters with ASCII equivalents
+_UNICODE_REPLACEMENTS = {
+    '←': '<-', '→': '->', '↑': '^', '↓': 'v',
+    '✓': 'v', '✗': 'x', '★': '*', '☆': '*',
+    '•': '*', '◦': '-', '‣': '*',
+    '"': '"', '"': '"', ''': "'", ''': "'",
+    '—': '-', '–': '-', '…': '...',
+    '®': '(R)', '©': '(C)', '™': '(TM)',
+}
+
+# Translation table for _clean_unicode_for_api: applies the replacements above and
+# drops control characters other than common whitespace (\n, \t, \r).
+_UNICODE_CLEAN_TABLE = str.maketrans({
+    **_UNICODE_REPLACEMENTS,
+    **{chr(c): None for c in range(32) if chr(c) not in '\n\t\r'},
+})
+
+
 def _clean_unicode_for_api(text) -> str:
     """Clean Unicode characters from text to prevent API encoding errors."""
     if not text:
@@ -199,27 +230,8 @@ def _clean_unicode_for_api(text) -> str:
             # 其他类型直接转换为字符串
             text = str(text)
     
-    # Replace common Unicode characters with ASCII equivalents
-    replacements = {
-        '←': '<-', '→': '->', '↑': '^', '↓': 'v',
-        '✓': 'v', '✗': 'x', '★': '*', '☆': '*',
-        '•': '*', '◦': '-', '‣': '*',
-        '"': '"', '"': '"', ''': "'", ''': "'",
-        '—': '-', '–': '-', '…': '...',
-        '®': '(R)', '©': '(C)', '™': '(TM)',
-    }
-    
-    # Apply replacements
-    for unicode_char, ascii_char in replacements.items():
-        text = text.replace(unicode_char, ascii_char)
-    
-    # Keep only ASCII characters and common whitespace
-    # This preserves Chinese/other non-ASCII but converts them to ? or removes them
-    # For a more aggressive approach, uncomment the line below:
-    # text = ''.join(c if ord(c) < 127 else '?' for c in text)
-    
-    # Less aggressive: only remove problematic control characters
-    text = ''.join(c for c in text if ord(c) >= 32 or c in '\n\t\r')
+    # 单次 C 级遍历完成符号替换与控制字符过滤（映射表在模块加载时构建）
+    text = text.translate(_UNICODE_CLEAN_TABLE)
     
     return text
 
@@ -439,17 +451,10 @@ def generate_stage1_directions(days: int = 7, query: str = "", api_key: str = No
         llm = llm_utils.get_llm(role="trend_report", temperature=0.3, api_key=api_key)
         try:
             resp = llm.invoke(prompt, enable_thinking=False)
-            from backend.llm import safe_get
-            initial_content = safe_get(resp, "content", "") or safe_get(resp, "text", "") or str(resp)
-            
-            if not isinstance(initial_content, str):
-                if isinstance(initial_content, list) and len(initial_content) > 0:
-                    if isinstance(initial_content[0], dict) and 'text' in initial_content[0]:
-                        initial_content = initial_content[0]['text']
-                    else:
-                        initial_content = ' '.join(str(item) for item in initial_content)
-                else:
-                    initial_content = str(initial_content) if initial_content else "# Stage 1 Generation Failed\n\nNo valid response from LLM"
+            initial_content = llm_utils.safe_get_text(
+                resp, "content", "text",
+                default="# Stage 1 Generation Failed\n\nNo valid response from LLM",
+            )
             
         except Exception as llm_error:
             print(f"[trend_report] LLM invocation error in Stage 1: {llm_error}")
@@ -558,8 +563,16 @@ def generate_stage1_directions(days: int = 7, query: str = "", api_key: str = No
         traceback.print_exc()
         return f"# Stage 1 Generation Failed\n\nError: {e}"
 
-def generate_stage2_talents(direction_name: str, direction_content: str, days: int = 7, api_key: str = None, include_international: bool = False, international_only: bool = False, data_snapshot: dict = None) -> str:
-    """Stage 2: Mixed talent search - 1 LLM generated + 1 direction search (total 2 talents)"""
+# Stage 2 人才数量不足 MIN_TALENTS 时的返回值：markdown 为 None，调用方据此跳过该方向
+_STAGE2_FAIL = {'markdown': None, 'structured_data': []}
+
+
+def generate_stage2_talents(direction_name: str, direction_content: str, days: int = 7, api_key: str = None, include_international: bool = False, international_only: bool = False, data_snapshot: dict = None, idx: int = None) -> str:
+    """Stage 2: Mixed talent search - 1 LLM generated + 1 direction search (total 2 talents)
+
+    idx: 方向序号；提供时标题直接输出为 "### {idx}) {direction_name}"（最终报告格式）
+    """
+    heading = _stage2_heading(direction_name, idx)
     try:
         # Step 1: Generate a talent name using LLM
         # 如果提供了数据快照，使用它；否则爬取新数据
@@ -590,19 +603,8 @@ def generate_stage2_talents(direction_name: str, direction_content: str, days: i
         llm = llm_utils.get_llm(role="trend_report", temperature=0.4, api_key=api_key)
         try:
             resp = llm.invoke(prompt, enable_thinking=False)
-            # 使用safe_get来安全获取内容
-            from backend.llm import safe_get
-            content = safe_get(resp, "content", "") or safe_get(resp, "text", "") or str(resp)
-            
-            # 确保返回的内容是字符串类型（Stage 2）
-            if not isinstance(content, str):
-                if isinstance(content, list) and len(content) > 0:
-                    if isinstance(content[0], dict) and 'text' in content[0]:
-                        content = content[0]['text']
-                    else:
-                        content = ' '.join(str(item) for item in content)
-                else:
-                    content = str(content) if content else ""
+            # safe_get_text 保证返回字符串（Stage 2）
+            content = llm_utils.safe_get_text(resp, "content", "text")
             
             generated_text = content.strip()
         except Exception as llm_error:
@@ -628,7 +630,6 @@ def generate_stage2_talents(direction_name: str, direction_content: str, days: i
                     clean_name = clean_name.split(':', 1)[-1].strip()
                 
                 # 移除可能的编号（1. 2. 等）
-                import re
                 clean_name = re.sub(r'^\d+[\.\)]\s*', '', clean_name).strip()
                 
                 # 移除markdown格式
@@ -714,65 +715,77 @@ def generate_stage2_talents(direction_name: str, direction_content: str, days: i
                 print(f"[Stage 2] 第二层失败: 无结果")
             
             # ========== 优中选优：按评分排序取top 5 ==========
-            print(f"[Stage 2] 候选池总计: {len(talents_found)} 个人才")
-            
-            # 按 total_score 降序排序
-            talents_found.sort(key=lambda t: t.get('total_score', 0), reverse=True)
+            logger.info("[Stage 2] 候选池总计: %d 个人才", len(talents_found))
             
-            # 取评分最高的前5个
-            talents_found = talents_found[:TARGET_TALENTS]
+            # 按 total_score 取评分最高的前5个（评分只读取一次，排序与打印复用）
+            decorated = [(t.get('total_score', 0), t) for t in talents_found]
+            top = heapq.nlargest(TARGET_TALENTS, decorated, key=itemgetter(0))
+            talents_found = [t for _, t in top]
             
-            print(f"[Stage 2] 优中选优: 从 {len(talents_from_tweets) + len(talents_from_direction)} 人中选出评分最高的 {len(talents_found)} 人")
-            for i, t in enumerate(talents_found, 1):
-                print(f"  {i}. {t.get('title', '未知')}: {t.get('total_score', 0)}/35")
+            logger.info("[Stage 2] 优中选优: 从 %d 人中选出评分最高的 %d 人",
+                        len(talents_from_tweets) + len(talents_from_direction), len(talents_found))
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, (score, t) in enumerate(top, 1):
+                    logger.debug("  %d. %s: %s/35", i, t.get('title', '未知'), score)
             
             # ========== 搜索总结 ==========
-            print(f"[Stage 2] 两层机制完成:")
-            print(f"  第一层（推文姓名）: {len(talents_from_tweets)} 人")
-            print(f"  第二层（方向搜索）: {len(talents_from_direction)} 人")
-            print(f"  总计: {len(talents_found)} 人")
+            logger.info("[Stage 2] 两层机制完成: 第一层（推文姓名）%d 人, 第二层（方向搜索）%d 人, 总计 %d 人",
+                        len(talents_from_tweets), len(talents_from_direction), len(talents_found))
             
             # Format the results
             if len(talents_found) >= MIN_TALENTS:
-                markdown_text = _format_talents_for_stage2(direction_name, talents_found)
+                markdown_text = _format_talents_for_stage2(direction_name, talents_found, idx=idx)
                 return {
                     'markdown': markdown_text,
                     'structured_data': talents_found
                 }
             else:
                 print(f"[Stage 2] 人才数量不足最低要求 ({len(talents_found)} < {MIN_TALENTS})")
-                return {
-                    'markdown': f"### {direction_name}\n\n*Failed to find minimum required talents ({len(talents_found)}/{MIN_TALENTS}). Please try again later.*",
-                    'structured_data': []
-                }
+                return dict(_STAGE2_FAIL, structured_data=[])
         
         except ImportError as ie:
             print(f"[Stage 2] Talent search module not available: {ie}")
             return {
-                'markdown': f"### {direction_name}\n\n*Talent search functionality unavailable: {ie}*",
+                'markdown': f"{heading}\n\n*Talent search functionality unavailable: {ie}*",
                 'structured_data': []
             }
         except Exception as search_error:
             print(f"[Stage 2] Network search error: {search_error}")
             return {
-                'markdown': f"### {direction_name}\n\n*Network search failed: {search_error}*",
+                'markdown': f"{heading}\n\n*Network search failed: {search_error}*",
                 'structured_data': []
             }
         
     except Exception as e:
         print(f"[trend_report] Stage 2 error for direction '{direction_name}': {e}")
         return {
-            'markdown': f"### {direction_name}\n\n*Talent generation failed: {e}*",
+            'markdown': f"{heading}\n\n*Talent generation failed: {e}*",
             'structured_data': []
         }
 
 
-def _format_talents_for_stage2(direction_name: str, talents: list) -> str:
+# Stage 2 角色推断：按顺序匹配 affiliation 中的关键词
+_STAGE2_ROLE_KEYWORDS = (
+    ("PhD", "PhD Student"),
+    ("Postdoc", "Postdoc"),
+    ("Professor", "Research Scientist"),
+)
+
+
+def _stage2_heading(direction_name: str, idx: int = None) -> str:
+    """Stage 2 方向标题；带序号时即为最终报告中 B. Talent 部分的格式"""
+    if idx is not None:
+        return f"### {idx}) {direction_name}"
+    return f"### {direction_name}"
+
+
+def _format_talents_for_stage2(direction_name: str, talents: list, idx: int = None) -> str:
     """Format network-searched talents into the expected Stage 2 output format"""
+    heading = _stage2_heading(direction_name, idx)
     if not talents:
-        return f"### {direction_name}\n\n*No talents found.*"
+        return f"{heading}\n\n*No talents found.*"
     
-    result = f"### {direction_name}\n\n"
+    parts = [f"{heading}\n\n"]
     
     for i, talent in enumerate(talents, 1):
         name = talent.get('title', 'Unknown Researcher')
@@ -788,16 +801,13 @@ def _format_talents_for_stage2(direction_name: str, talents: list) -> str:
         if len(notable_contribution) > 200:
             notable_contribution = notable_contribution[:200] + "..."
             
-        # Determine role from affiliation or default
-        role = "Researcher"  # Default
-        if "PhD" in affiliation:
-            role = "PhD Student"
-        elif "Postdoc" in affiliation:
-            role = "Postdoc"
-        elif "Professor" in affiliation:
-            role = "Research Scientist"
+        # Determine role from affiliation (first matching keyword wins)
+        role = next(
+            (r for keyword, r in _STAGE2_ROLE_KEYWORDS if keyword in affiliation),
+            "Researcher",
+        )
         
-        result += f"""#### {i}.1 {name}
+        parts.append(f"""#### {i}.1 {name}
 **Affiliation**: {affiliation}
 **Role**: {role}
 **Research Focus**: {research_desc}
@@ -805,9 +815,9 @@ def _format_talents_for_stage2(direction_name: str, talents: list) -> str:
 **Contact Potential**: Early-career researcher with strong publication record
 **Source**: Network Search
 
-"""
+""")
     
-    return result
+    return "".join(parts)
 
 def generate_stage3_detailed_report(direction_name: str, direction_content: str, days: int = 7, api_key: str = None, include_international: bool = False, international_only: bool = False, data_snapshot: dict = None) -> str:
     """Stage 3: Generate detailed report for each direction"""
@@ -839,22 +849,13 @@ def generate_stage3_detailed_report(direction_name: str, direction_content: str,
         # 传递 api_key 以支持多线程环境（ThreadPoolExecutor 无法访问 session_state）
         llm = llm_utils.get_llm(role="trend_detail", temperature=0.3, api_key=api_key)
         try:
-            resp = llm.invoke(prompt, enable_thinking=False)
-            # 使用safe_get来安全获取内容
-            from backend.llm import safe_get
-            content = safe_get(resp, "content", "") or safe_get(resp, "text", "") or str(resp)
-            
-            # 确保返回的内容是字符串类型（Stage 3）
-            if not isinstance(content, str):
-                if isinstance(content, list) and len(content) > 0:
-                    if isinstance(content[0], dict) and 'text' in content[0]:
-                        content = content[0]['text']
-                    else:
-                        content = ' '.join(str(item) for item in content)
-                else:
-                    content = str(content) if content else f"## {direction_name} - Detailed Report\n\nNo valid response from LLM"
-            
-            return content
+            with _LLM_SEM:
+                resp = llm.invoke(prompt, enable_thinking=False)
+            # safe_get_text 保证返回字符串（Stage 3）
+            return llm_utils.safe_get_text(
+                resp, "content", "text",
+                default=f"## {direction_name} - Detailed Report\n\nNo valid response from LLM",
+            )
         except Exception as llm_error:
             print(f"[trend_report] LLM invocation error in Stage 3: {llm_error}")
             return f"## {direction_name} - Detailed Report\n\nLLM Error: {llm_error}"
@@ -863,6 +864,17 @@ def generate_stage3_detailed_report(direction_name: str, direction_content: str,
         print(f"[trend_report] Stage 3 error for direction '{direction_name}': {e}")
         return f"## {direction_name} - Detailed Report\n\n*Detailed report generation failed: {e}*"
 
+
+# 解析 Stage 1 输出中的方向标题 - 尝试多种可能的格式，按实际生成的格式优先排序
+_DIRECTION_PATTERNS = (
+    re.compile(r'^###\s+(\d+)\.\s+\*\*(.+?)\*\*', re.MULTILINE),  # ### 1. **方向名称** (实际格式)
+    re.compile(r'^###\s+(\d+)\.\s+(.+)$', re.MULTILINE),         # ### 1. 方向名称
+    re.compile(r'^\s*(\d+)\.\s+(.+)$', re.MULTILINE),            # 1. 方向名称
+    re.compile(r'^\s*(\d+)\.\s+\*\*(.+?)\*\*', re.MULTILINE),     # 1. **方向名称**
+    re.compile(r'^\s*(\d+)\)\s+(.+)$', re.MULTILINE),            # 1) 方向名称
+)
+
+
 def generate_three_stage_report(days: int = 7, query: str = "", progress_callback=None, api_key: str = None, include_international: bool = False, international_only: bool = False, data_snapshot: dict = None) -> Dict[str, str]:
     """Execute complete three-stage generation workflow"""
     result = {
@@ -880,7 +892,10 @@ def generate_three_stage_report(days: int = 7, query: str = "", progress_callbac
             if progress_callback:
                 progress_callback(1, 10, "Fetching fresh data...")
             data_snapshot = trend_data.query_recent_articles(days=days, include_international=include_international, international_only=international_only)
-            print(f"[trend_report] Data snapshot ready: {sum(len(articles) for articles in data_snapshot.values())} total articles")
+            # trend_data 已打印文章总数，这里仅在开启 INFO 日志时再统计一次
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[trend_report] Data snapshot ready: %d total articles",
+                            sum(len(articles) for articles in data_snapshot.values()))
         else:
             print("[trend_report] Using provided data snapshot")
         
@@ -892,23 +907,13 @@ def generate_three_stage_report(days: int = 7, query: str = "", progress_callbac
         result["stage1_directions"] = stage1_result
         
         # 解析方向 - 修复正则表达式以匹配实际输出格式
-        import re
-        # 尝试多种可能的方向格式 - 按实际生成的格式优先排序
-        direction_patterns = [
-            re.compile(r'^###\s+(\d+)\.\s+\*\*(.+?)\*\*', re.MULTILINE),  # ### 1. **方向名称** (实际格式)
-            re.compile(r'^###\s+(\d+)\.\s+(.+)$', re.MULTILINE),         # ### 1. 方向名称
-            re.compile(r'^\s*(\d+)\.\s+(.+)$', re.MULTILINE),            # 1. 方向名称
-            re.compile(r'^\s*(\d+)\.\s+\*\*(.+?)\*\*', re.MULTILINE),     # 1. **方向名称**
-            re.compile(r'^\s*(\d+)\)\s+(.+)$', re.MULTILINE),            # 1) 方向名称
-        ]
-        
         directions = {}
         direction_matches = []
         
-        # 尝试不同的模式直到找到匹配
-        for pattern in direction_patterns:
-            direction_matches = list(pattern.finditer(stage1_result))
-            if direction_matches:
+        # 尝试不同的模式直到找到匹配（先用 search 探测，命中后才物化全部匹配）
+        for pattern in _DIRECTION_PATTERNS:
+            if pattern.search(stage1_result):
+                direction_matches = list(pattern.finditer(stage1_result))
                 print(f"[trend_report] Using pattern: {pattern.pattern}")
                 break
         
@@ -916,7 +921,7 @@ def generate_three_stage_report(days: int = 7, query: str = "", progress_callbac
             print(f"[trend_report] Warning: No direction pattern matched. First 500 chars of stage1_result:")
             print(repr(stage1_result[:500]))
         
-        for i, match in enumerate(direction_matches):
+        for match, next_match in zip(direction_matches, direction_matches[1:] + [None]):
             dir_num = match.group(1)
             dir_name = match.group(2).strip()
             
@@ -934,16 +939,7 @@ def generate_three_stage_report(days: int = 7, query: str = "", progress_callbac
             
             # 提取该方向的内容 (从当前匹配到下一个方向或文件结尾)
             start_pos = match.start()
-            next_match = None
-            for j, next_m in enumerate(direction_matches):
-                if j > i:  # 找到下一个匹配
-                    next_match = next_m
-                    break
-            
-            if next_match:
-                end_pos = next_match.start()
-            else:
-                end_pos = len(stage1_result)
+            end_pos = next_match.start() if next_match else len(stage1_result)
             
             dir_content = stage1_result[start_pos:end_pos].strip()
             directions[dir_name] = dir_content
@@ -956,32 +952,11 @@ def generate_three_stage_report(days: int = 7, query: str = "", progress_callbac
             progress_callback(2, 60, "Stage 2: Generating recruitable talents for each direction...")
         
         stage2_talents_structured = {}  # 保存结构化人才数据
-        for dir_name, dir_content in directions.items():
-            print(f"[trend_report] Generating talents for: {dir_name}")
-            talents_result = generate_stage2_talents(dir_name, dir_content, days=days, api_key=api_key, include_international=include_international, international_only=international_only, data_snapshot=data_snapshot)
-            
-            # 处理新的返回格式（字典：markdown + structured_data）
-            if isinstance(talents_result, dict):
-                result["stage2_talents"][dir_name] = talents_result.get('markdown', '')
-                stage2_talents_structured[dir_name] = talents_result.get('structured_data', [])
-            else:
-                # 向后兼容：如果返回的是字符串（旧格式）
-                result["stage2_talents"][dir_name] = talents_result
-                stage2_talents_structured[dir_name] = []
-        
-        # 保存结构化人才数据到结果中
-        result["stage2_talents_structured"] = stage2_talents_structured
-        
-        # 阶段3: 并行生成详细报告
-        print("[trend_report] Starting Stage 3: Generating detailed reports (parallel)...")
-        if progress_callback:
-            progress_callback(3, 80, "Stage 3: Generating detailed reports (parallel)...")
-
-        stage3_reports: Dict[str, str] = {}
+        stage2_results = {}
         with ThreadPoolExecutor(max_workers=len(directions) or 1) as executor:
             future_to_dir = {
                 executor.submit(
-                    generate_stage3_detailed_report,
+                    generate_stage2_talents,
                     dir_name,
                     dir_content,
                     days,
@@ -989,39 +964,99 @@ def generate_three_stage_report(days: int = 7, query: str = "", progress_callbac
                     include_international,
                     international_only,
                     data_snapshot,
-                ): dir_name
-                for dir_name, dir_content in directions.items()
+                    idx,
+                ): (idx, dir_name)
+                for idx, (dir_name, dir_content) in enumerate(directions.items(), 1)
             }
 
             completed = 0
             for future in as_completed(future_to_dir):
-                dir_name = future_to_dir[future]
+                idx, dir_name = future_to_dir[future]
                 try:
-                    stage3_reports[dir_name] = future.result()
+                    stage2_results[dir_name] = future.result()
                 except Exception as e:
-                    stage3_reports[dir_name] = f"## {dir_name} - Detailed Report\n\n*Generation failed: {e}*"
+                    stage2_results[dir_name] = {
+                        'markdown': f"{_stage2_heading(dir_name, idx)}\n\n*Talent generation failed: {e}*",
+                        'structured_data': []
+                    }
                 completed += 1
-                print(f"[trend_report] Stage 3 progress: {completed}/{len(directions)} completed")
+                print(f"[trend_report] Stage 2 progress: {completed}/{len(directions)} completed")
+
+        # 按direction顺序写回结果，保证最终报告中的方向顺序与Stage 1一致
+        shown = 0
+        for idx, dir_name in enumerate(directions, 1):
+            talents_result = stage2_results[dir_name]
+
+            # 处理新的返回格式（字典：markdown + structured_data）
+            if isinstance(talents_result, dict):
+                markdown = talents_result.get('markdown', '')
+                stage2_talents_structured[dir_name] = talents_result.get('structured_data', [])
+            else:
+                # 向后兼容：如果返回的是字符串（旧格式）
+                markdown = talents_result
+                stage2_talents_structured[dir_name] = []
+
+            # markdown 为 None 表示该方向人才不足，最终报告中跳过
+            if markdown is None:
+                continue
+
+            # 跳过的方向会让 Stage 1 的序号出现空缺，按实际输出顺序重新编号
+            shown += 1
+            heading = _stage2_heading(dir_name, idx)
+            if shown != idx and markdown.startswith(heading):
+                markdown = _stage2_heading(dir_name, shown) + markdown[len(heading):]
+            result["stage2_talents"][dir_name] = markdown
+
+        # 保存结构化人才数据到结果中
+        result["stage2_talents_structured"] = stage2_talents_structured
+        
+        # 阶段3: 并行生成详细报告
+        print("[trend_report] Starting Stage 3: Generating detailed reports (parallel)...")
+        if progress_callback:
+            progress_callback(3, 80, "Stage 3: Generating detailed reports (parallel)...")
+
+        stage3_reports: Dict[str, str] = {}
+        future_to_dir = {
+            _LLM_POOL.submit(
+                generate_stage3_detailed_report,
+                dir_name,
+                dir_content,
+                days,
+                api_key,
+                include_international,
+                international_only,
+                data_snapshot,
+            ): dir_name
+            for dir_name, dir_content in directions.items()
+        }
+
+        completed = 0
+        for future in as_completed(future_to_dir):
+            dir_name = future_to_dir[future]
+            try:
+                stage3_reports[dir_name] = future.result()
+            except Exception as e:
+                stage3_reports[dir_name] = f"## {dir_name} - Detailed Report\n\n*Generation failed: {e}*"
+            completed += 1
+            print(f"[trend_report] Stage 3 progress: {completed}/{len(directions)} completed")
 
         result["stage3_detailed_reports"] = stage3_reports
         
-        # 组装最终报告 - 格式化为前端期望的结构
-        final_report_parts = [stage1_result]
+        # 组装最终报告 - 格式化为前端期望的结构（直接写入缓冲区，空行间距与原先一致）
+        buf = io.StringIO()
+        buf.write(stage1_result)
         
         # 添加 Talent 部分
         if result["stage2_talents"]:
-            final_report_parts.append("\n\n## B. Talent")
-            final_report_parts.append("\n")
+            buf.write("\n\n\n## B. Talent\n\n")
             
-            # 按direction顺序组装talent内容  
-            for idx, (dir_name, talent_content) in enumerate(result["stage2_talents"].items(), 1):
-                # 将Stage 2的输出格式转换为前端期望的格式
-                # 从 "### Direction Name" 转换为 "### 1) Direction Name"
-                formatted_talent = talent_content.replace(f"### {dir_name}", f"### {idx}) {dir_name}")
-                final_report_parts.append(formatted_talent)
-                final_report_parts.append("\n")
+            # 按direction顺序组装talent内容（Stage 2 已输出 "### 1) Direction Name" 格式的标题）
+            for talent_content in result["stage2_talents"].values():
+                buf.write("\n")
+                buf.write(talent_content)
+                buf.write("\n\n")
         
-        result["final_report"] = "\n".join(final_report_parts)
+        result["final_report"] = buf.getvalue()
         
         print("[trend_report] Three-stage generation completed successfully!")
         if progress_callback:
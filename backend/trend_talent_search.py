@@ -7,10 +7,18 @@ Integrate Targeted Search SearXNG functionality into Trend Radar
 import sys
 import os
 import re
+import atexit
 import json
+import logging
 import time
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple, FrozenSet
 from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import chain
+
+logger = logging.getLogger(__name__)
 
 # Add trend_radar_search to path
 current_dir = os.path.dirname(__file__)
@@ -18,6 +26,22 @@ trend_radar_search = os.path.join(current_dir, 'trend_radar_search')
 if trend_radar_search not in sys.path:
     sys.path.append(trend_radar_search)
 
+def _build_http_session():
+    """创建带连接池和连接级重试的 requests.Session，供所有人才搜索请求复用"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=50,
+        pool_maxsize=50,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 # Step-by-step import for better error messages
 missing_deps = []
 TALENT_SEARCH_AVAILABLE = False
@@ -48,6 +72,7 @@ try:
     from trend_radar_search.search import searxng_search
     from trend_radar_search.agents import agent_execute_search, _run_search_terms
     from trend_radar_search.author_discovery import discover_author_profile
+    from trend_radar_search.author_discovery import orchestrate_candidate_report as _orchestrate_candidate_report
     from trend_radar_search.extraction import synthesize_candidates
     from trend_radar_search.schemas import QuerySpec, CandidateOverview
     from backend import config
@@ -63,6 +88,200 @@ except Exception as e:
     print(f"[ERROR] Unexpected error loading talent search module: {e}")
     TALENT_SEARCH_AVAILABLE = False
 
+# 为下游 SearXNG/抓取请求注入共享的连接池 Session（OpenReview、Scholar、SearXNG 等重复主机复用连接）
+# 连接池只是优化：搜索模块没有 set_session 时沿用其自带的请求方式，不影响搜索是否可用
+if TALENT_SEARCH_AVAILABLE:
+    import trend_radar_search.search as _trend_search_module
+    _set_search_session = getattr(_trend_search_module, 'set_session', None)
+    if _set_search_session is not None:
+        _HTTP_SESSION = _build_http_session()
+        _set_search_session(_HTTP_SESSION)
+        atexit.register(_HTTP_SESSION.close)
+    else:
+        print("[INFO] trend_radar_search.search has no set_session(); talent search runs without the pooled HTTP session")
+
+
+def _install_searxng_limiter() -> None:
+    """用进程级 BoundedSemaphore 包住 trend_radar_search 的 searxng_search，限制同时在途的请求数
+
+    Stage 2 多方向、每个方向多线程并发时 SearXNG 调用会成倍放大；各模块按名字导入了该函数，
+    因此把已加载模块中指向原函数的引用（含以顶层 search 模块导入的副本）都替换为限流版本
+    """
+    global searxng_search
+    own = searxng_search
+    originals = {own}
+    for mod_name in ('search', 'trend_radar_search.search'):
+        func = getattr(sys.modules.get(mod_name), 'searxng_search', None)
+        if func is not None:
+            originals.add(func)
+    slots = threading.BoundedSemaphore(config.SEARXNG_CONCURRENCY)
+    limited = {}  # {id(原函数): 限流版本}
+    for func in originals:
+        def _limited_searxng_search(*args, _func=func, **kwargs):
+            with slots:
+                return _func(*args, **kwargs)
+        limited[id(func)] = wraps(func)(_limited_searxng_search)
+    for mod in list(sys.modules.values()):
+        func = getattr(mod, 'searxng_search', None)
+        if func is not None and any(func is orig for orig in originals):
+            mod.searxng_search = limited[id(func)]
+    searxng_search = limited[id(own)]
+
+
+if TALENT_SEARCH_AVAILABLE:
+    _install_searxng_limiter()
+
+# LLM 姓名验证使用；不可用时验证函数回退到规则判断
+try:
+    from backend import llm as llm_utils
+except ImportError:
+    llm_utils = None
+
+# 姓名/方向并发搜索的上限：SearXNG 在 6-7 个以上并发请求时开始返回空结果
+SEARCH_CONCURRENCY = 8
+
+# 单个姓名/方向搜索中可预期的失败类型（网络、超时、数据解析）；其余异常视为程序错误，不在此吞掉
+try:
+    import requests as _requests
+    _SEARCH_ERRORS = (_requests.RequestException, TimeoutError, ValueError)
+except ImportError:
+    _SEARCH_ERRORS = (TimeoutError, ValueError)
+
+
+# orchestrate_candidate_report 结果缓存：作者档案变化缓慢，趋势刷新时重复出现的姓名直接命中
+# 键只包含决定结果的输入 (name, paper_url, lightweight)，不包含 api_key
+_ORCHESTRATE_TTL = 7 * 24 * 3600  # 7 天
+_ORCHESTRATE_MEMO: Dict[tuple, tuple] = {}  # {key: (expires_at, result)}
+_ORCHESTRATE_MEMO_LOCK = threading.Lock()
+try:
+    import diskcache  # 可选：安装后跨进程持久化缓存（键以 'orchestrate' / 'name_verdict' 区分命名空间）
+    _DISK_CACHE = diskcache.Cache(os.path.join(current_dir, '.talent_cache'))
+except Exception:
+    _DISK_CACHE = None
+
+
+def _cached_orchestrate(name: str, paper_url: Optional[str] = None, lightweight: bool = True,
+                        api_key: str = None, force_refresh: bool = False):
+    """带 TTL（内存 + 可选磁盘）缓存的 orchestrate_candidate_report，只缓存找到档案的结果"""
+    key = (name.lower().strip(), paper_url or '', bool(lightweight))
+    now = time.time()
+    
+    if not force_refresh:
+        with _ORCHESTRATE_MEMO_LOCK:
+            hit = _ORCHESTRATE_MEMO.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+        if _DISK_CACHE is not None:
+            result = _DISK_CACHE.get(('orchestrate',) + key)
+            if result is not None:
+                with _ORCHESTRATE_MEMO_LOCK:
+                    _ORCHESTRATE_MEMO[key] = (now + _ORCHESTRATE_TTL, result)
+                return result
+    
+    result = _orchestrate_candidate_report(
+        first_author=name,
+        paper_title="",           # 没有论文标题
+        paper_url=paper_url,
+        aliases=[],               # 没有别名
+        k_queries=10,             # 适度的查询数量
+        author_id=None,
+        api_key=api_key,
+        use_lightweight_mode=lightweight
+    )
+    
+    # 未找到档案可能是暂时性失败，不缓存
+    if result[1] is not None:
+        with _ORCHESTRATE_MEMO_LOCK:
+            _ORCHESTRATE_MEMO[key] = (now + _ORCHESTRATE_TTL, result)
+        if _DISK_CACHE is not None:
+            _DISK_CACHE.set(('orchestrate',) + key, result, expire=_ORCHESTRATE_TTL)
+    return result
+
+
+# 可选：rapidfuzz 提供 C++ 实现的模糊姓名匹配（处理词序、标点）；未安装时回退到单词重合判断
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process, utils as rf_utils
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+NAME_MATCH_THRESHOLD = 92  # token_set_ratio 达到该分数视为同名
+
+# 可选：Double Metaphone 语音编码，用于模糊匹配前的分桶（只比较发音相近的姓名）
+try:
+    from metaphone import doublemetaphone
+    HAS_METAPHONE = True
+except ImportError:
+    HAS_METAPHONE = False
+
+_NON_LETTER_RE = re.compile(r'[\W\d_]+')
+
+
+def _name_similarity(name1: str, name2: str) -> float:
+    """两个姓名的 token_set_ratio 相似度（0-100），需要 rapidfuzz"""
+    return rf_fuzz.token_set_ratio(name1, name2, processor=rf_utils.default_process)
+
+
+def _phonetic_codes(norm_name: str) -> set:
+    """姓名中每个单词的 Double Metaphone 主/次编码（按所有单词编码，以兼容姓名词序颠倒）"""
+    codes = set()
+    for word in norm_name.split():
+        word = _NON_LETTER_RE.sub('', word)
+        if word:
+            codes.update(code for code in doublemetaphone(word) if code)
+    return codes
+
+
+# LLM 姓名验证结论缓存：结论只取决于姓名本身，跨方向/刷新复用，节省 LLM 调用
+# {name_key: (verdict, expires_at)}；verdict 为 None 表示 LLM 调用失败（短期负缓存）
+_NAME_VERDICT_CACHE: Dict[str, Tuple[Optional[bool], float]] = {}
+_NAME_VERDICT_LOCK = threading.Lock()
+_NAME_VERDICT_ERROR_TTL = 5 * 60  # LLM 出错后 5 分钟内不再重试
+
+
+def _name_verdict_key(name: str) -> str:
+    return name.lower().strip()
+
+
+def _get_name_verdict(name: str) -> Tuple[bool, Optional[bool]]:
+    """返回 (是否命中缓存, 缓存的结论)"""
+    key = _name_verdict_key(name)
+    with _NAME_VERDICT_LOCK:
+        hit = _NAME_VERDICT_CACHE.get(key)
+    if hit is not None:
+        if hit[1] > time.time():
+            return True, hit[0]
+    elif _DISK_CACHE is not None:
+        verdict = _DISK_CACHE.get(('name_verdict', key))
+        if verdict is not None:
+            with _NAME_VERDICT_LOCK:
+                _NAME_VERDICT_CACHE[key] = (verdict, float('inf'))
+            return True, verdict
+    return False, None
+
+
+def _set_name_verdict(name: str, verdict: Optional[bool]) -> None:
+    """记录 LLM 结论；verdict 为 None 时只做短期内存负缓存"""
+    key = _name_verdict_key(name)
+    expires_at = float('inf') if verdict is not None else time.time() + _NAME_VERDICT_ERROR_TTL
+    with _NAME_VERDICT_LOCK:
+        _NAME_VERDICT_CACHE[key] = (verdict, expires_at)
+    if verdict is not None and _DISK_CACHE is not None:
+        _DISK_CACHE.set(('name_verdict', key), verdict)
+
+
+# 人才去重时的姓名清理：去除头衔前缀（professor 需排在 prof 之前，否则只会去掉 "prof"）
+_TITLE_RE = re.compile(r'\b(?:dr\.?|professor|prof\.?)\s*', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+
+class _TalentNorm(NamedTuple):
+    """查重用的归一化字段，每条人才记录只计算一次"""
+    norm_name: str
+    word_set: FrozenSet[str]
+    email: str
+
+
 class GlobalTalentManager:
     """全局人才管理器，负责跨方向的人才去重和分配"""
     
@@ -70,16 +289,73 @@ class GlobalTalentManager:
         self.talent_pool = {}  # 人才池：{talent_key: talent_data}
         self.direction_assignments = {}  # 方向分配：{direction: [talent_keys]}
         self.talent_to_directions = {}  # 人才到方向的映射：{talent_key: [directions]}
+        self._lock = threading.Lock()  # Stage 2 多方向并发调用时保护查重+插入
+        # 查重索引：只与可能是同一人的记录比较，避免每次插入扫描整个人才池
+        self._by_email: Dict[str, str] = {}  # {email: talent_key}
+        self._by_norm_name: Dict[str, List[str]] = {}  # {清理后姓名: [talent_keys]}
+        self._by_name_token: Dict[str, List[str]] = {}  # {姓名单词: [talent_keys]}，覆盖单词子集匹配
+        self._by_phonetic: Dict[str, List[str]] = {}  # {语音编码: [清理后姓名]}，模糊匹配前的分桶
+        self._talent_norms: Dict[str, _TalentNorm] = {}  # {talent_key: 归一化字段}，比较时不再重复计算
     
-    def _generate_talent_key(self, talent: Dict[str, Any]) -> str:
-        """为人才生成唯一标识符"""
-        # 使用姓名、邮箱等信息生成唯一key
+    @staticmethod
+    def _normalize_talent(talent: Dict[str, Any]) -> _TalentNorm:
+        """返回 (清理后姓名, 姓名单词集合, 小写邮箱)"""
         name = talent.get('title', '').lower().strip()
-        email = talent.get('email', '').lower().strip()
-        
         # 清理姓名，去除常见前缀和后缀
-        name = re.sub(r'\b(dr\.?|prof\.?|professor)\s*', '', name)
-        name = re.sub(r'\s+', ' ', name).strip()
+        name = _TITLE_RE.sub('', name)
+        norm_name = _WS_RE.sub(' ', name).strip()
+        return _TalentNorm(norm_name, frozenset(norm_name.split()), talent.get('email', '').lower().strip())
+    
+    def _candidate_keys(self, norm: _TalentNorm, fuzzy_keys: Optional[List[str]] = None) -> List[str]:
+        """从索引中取出可能与给定姓名/邮箱为同一人的人才key（邮箱相同、姓名相同或共享姓名单词）
+        
+        fuzzy_keys 为批量打分时预先算出的模糊命中；未提供时在此单独做模糊匹配
+        """
+        norm_name, email = norm.norm_name, norm.email
+        keys = []
+        if email and email in self._by_email:
+            keys.append(self._by_email[email])
+        keys.extend(self._by_norm_name.get(norm_name, ()))
+        for word in norm.word_set:
+            keys.extend(self._by_name_token.get(word, ()))
+        if fuzzy_keys is not None:
+            keys.extend(fuzzy_keys)
+        elif HAS_RAPIDFUZZ and norm_name and self._by_norm_name:
+            # 模糊匹配可能命中不共享任何单词的姓名（如 "smith, john" / "john smith"），单次 C 级扫描找出
+            for match, _score, _idx in rf_process.extract(
+                norm_name, self._fuzzy_block(norm_name), scorer=rf_fuzz.token_set_ratio,
+                processor=rf_utils.default_process, score_cutoff=NAME_MATCH_THRESHOLD, limit=None,
+            ):
+                keys.extend(self._by_norm_name[match])
+        return list(dict.fromkeys(keys))
+    
+    def _fuzzy_block(self, norm_name: str) -> List[str]:
+        """需要做模糊比较的人才池姓名：有语音编码时只取同编码分桶，否则为全部姓名"""
+        if not HAS_METAPHONE:
+            return list(self._by_norm_name)
+        names = []
+        for code in _phonetic_codes(norm_name):
+            names.extend(self._by_phonetic.get(code, ()))
+        return list(dict.fromkeys(names))
+    
+    def _index_talent(self, talent_key: str, norm: _TalentNorm) -> None:
+        """将新加入人才池的记录写入查重索引"""
+        norm_name, email = norm.norm_name, norm.email
+        self._talent_norms[talent_key] = norm
+        if email:
+            self._by_email.setdefault(email, talent_key)
+        if norm_name:
+            if HAS_METAPHONE and norm_name not in self._by_norm_name:
+                for code in _phonetic_codes(norm_name):
+                    self._by_phonetic.setdefault(code, []).append(norm_name)
+            self._by_norm_name.setdefault(norm_name, []).append(talent_key)
+            for word in norm.word_set:
+                self._by_name_token.setdefault(word, []).append(talent_key)
+    
+    def _generate_talent_key(self, talent: Dict[str, Any], norm: Optional[_TalentNorm] = None) -> str:
+        """为人才生成唯一标识符"""
+        # 使用姓名、邮箱等信息生成唯一key
+        name, _, email = norm or self._normalize_talent(talent)
         
         if email:
             return f"{name}|{email}"
@@ -90,40 +366,31 @@ class GlobalTalentManager:
     
     def _is_same_person(self, talent1: Dict[str, Any], talent2: Dict[str, Any]) -> bool:
         """判断两个人才记录是否为同一人"""
-        name1 = talent1.get('title', '').lower().strip()
-        name2 = talent2.get('title', '').lower().strip()
-        email1 = talent1.get('email', '').lower().strip()
-        email2 = talent2.get('email', '').lower().strip()
-        
-        # 清理姓名
-        name1 = re.sub(r'\b(dr\.?|prof\.?|professor)\s*', '', name1)
-        name2 = re.sub(r'\b(dr\.?|prof\.?|professor)\s*', '', name2)
-        name1 = re.sub(r'\s+', ' ', name1).strip()
-        name2 = re.sub(r'\s+', ' ', name2).strip()
-        
-        # 如果有邮箱且相同，则为同一人
-        if email1 and email2 and email1 == email2:
-            return True
+        return self._is_same_person_norm(self._normalize_talent(talent1), self._normalize_talent(talent2))
+    
+    @staticmethod
+    def _is_same_person_norm(norm1: _TalentNorm, norm2: _TalentNorm) -> bool:
+        """基于预先归一化的字段判断是否为同一人"""
+        name1, name1_words, email1 = norm1
+        name2, name2_words, email2 = norm2
+        
+        # 快速路径：双方都有邮箱时结论只取决于邮箱——相同为同一人；
+        # 不同则即使姓名相同/相似也视为不同人，无需做任何姓名比较
+        if email1 and email2:
+            return email1 == email2
         
-        # 如果姓名完全相同，需要进一步检查邮箱
+        # 以下至少一方没有邮箱：姓名完全相同则认为是同一人
         if name1 and name2 and name1 == name2:
-            # 如果两个人姓名完全相同，但都有不同的邮箱，则认为是不同人
-            if email1 and email2 and email1 != email2:
-                return False
-            # 如果姓名相同且邮箱相同或至少有一个没有邮箱，则认为是同一人
             return True
         
-        # 如果姓名相似度很高，也认为是同一人（但只在邮箱匹配或缺失时）
+        # 如果姓名相似度很高，也认为是同一人
         if name1 and name2:
-            name1_words = set(name1.split())
-            name2_words = set(name2.split())
             if len(name1_words) >= 2 and len(name2_words) >= 2:
+                if HAS_RAPIDFUZZ:
+                    # token_set_ratio 忽略词序/标点，子集关系得分为100
+                    return _name_similarity(name1, name2) >= NAME_MATCH_THRESHOLD
                 overlap = len(name1_words.intersection(name2_words))
-                min_words = min(len(name1_words), len(name2_words))
-                if overlap >= min_words:  # 所有词都匹配
-                    # 只有在邮箱匹配或至少一个邮箱缺失的情况下才认为是同一人
-                    if not email1 or not email2 or email1 == email2:
-                        return True
+                return overlap >= min(len(name1_words), len(name2_words))  # 所有词都匹配
         
         return False
     
@@ -134,16 +401,72 @@ class GlobalTalentManager:
         Returns:
             bool: True if added successfully, False if already exists
         """
-        talent_key = self._generate_talent_key(talent)
+        with self._lock:
+            return self._add_locked(talent, self._normalize_talent(talent), direction)
+    
+    def would_accept(self, name: str, email: str = '') -> bool:
+        """只查索引不写入：判断该姓名/邮箱的人才当前是否会被接受（尚不在人才池中）"""
+        norm = self._normalize_talent({'title': name or '', 'email': email or ''})
+        with self._lock:
+            return not any(
+                self._is_same_person_norm(norm, self._talent_norms[key])
+                for key in self._candidate_keys(norm)
+            )
+    
+    def add_talents_to_direction(self, talents: List[Dict[str, Any]], direction: str,
+                                 limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        按顺序批量添加人才到指定方向，最多添加 limit 位
+        
+        有 rapidfuzz 时一次性计算新候选与人才池（及本批次）姓名的相似度矩阵，
+        替代逐个候选的模糊扫描；最终判定仍走 _is_same_person_norm（含邮箱规则）
+        
+        Returns:
+            List[Dict[str, Any]]: 成功添加的人才
+        """
+        with self._lock:
+            norms = [self._normalize_talent(t) for t in talents]
+            pool_names = list(self._by_norm_name)
+            new_names = [n.norm_name for n in norms]
+            scores = None
+            if HAS_RAPIDFUZZ and talents:
+                scores = rf_process.cdist(
+                    new_names, pool_names + new_names, scorer=rf_fuzz.token_set_ratio,
+                    processor=rf_utils.default_process, score_cutoff=NAME_MATCH_THRESHOLD, workers=-1,
+                )
+            added = []
+            batch_keys: List[Optional[str]] = []  # 本批次第 j 位候选入池后的 talent_key
+            for i, (talent, norm) in enumerate(zip(talents, norms)):
+                if limit is not None and len(added) >= limit:
+                    break
+                fuzzy_keys = None
+                if scores is not None and norm.norm_name:
+                    fuzzy_keys = []
+                    for col in scores[i].nonzero()[0]:
+                        if col < len(pool_names):
+                            fuzzy_keys.extend(self._by_norm_name[pool_names[col]])
+                        elif col - len(pool_names) < i and batch_keys[col - len(pool_names)]:
+                            fuzzy_keys.append(batch_keys[col - len(pool_names)])
+                talent_key = self._add_locked(talent, norm, direction, fuzzy_keys)
+                batch_keys.append(talent_key)
+                if talent_key:
+                    added.append(talent)
+            return added
+    
+    def _add_locked(self, talent: Dict[str, Any], norm: _TalentNorm, direction: str,
+                    fuzzy_keys: Optional[List[str]] = None) -> Optional[str]:
+        """查重并写入人才池（调用方需持有 self._lock）；成功返回 talent_key，重复返回 None"""
+        talent_key = self._generate_talent_key(talent, norm)
         
-        # 检查是否已存在相同的人才
-        for existing_key, existing_talent in self.talent_pool.items():
-            if self._is_same_person(talent, existing_talent):
+        # 检查是否已存在相同的人才（只比较索引命中的候选）
+        for existing_key in self._candidate_keys(norm, fuzzy_keys):
+            if self._is_same_person_norm(norm, self._talent_norms[existing_key]):
                 print(f"人才 '{talent.get('title', 'Unknown')}' 已存在，跳过重复添加 (现有方向: {self.talent_to_directions.get(existing_key, [])})")
-                return False
+                return None
         
         # 添加新人才
         self.talent_pool[talent_key] = talent
+        self._index_talent(talent_key, norm)
         
         # 记录方向分配
         if direction not in self.direction_assignments:
@@ -156,7 +479,19 @@ class GlobalTalentManager:
         self.talent_to_directions[talent_key].append(direction)
         
         print(f"[GlobalTalentManager] Added talent '{talent.get('title', 'Unknown')}' to direction '{direction}'")
-        return True
+        return talent_key
+    
+    def reset(self) -> None:
+        """清空人才池与方向分配"""
+        with self._lock:
+            self.talent_pool = {}
+            self.direction_assignments = {}
+            self.talent_to_directions = {}
+            self._by_email.clear()
+            self._by_norm_name.clear()
+            self._by_name_token.clear()
+            self._by_phonetic.clear()
+            self._talent_norms.clear()
     
     def get_direction_talents(self, direction: str) -> List[Dict[str, Any]]:
         """获取指定方向的人才列表"""
@@ -170,7 +505,7 @@ class GlobalTalentManager:
     def get_stats(self) -> Dict[str, Any]:
         """获取人才统计信息"""
         return {
-            "total_unique_talents": len(self.talent_pool),
+            "total_unique_talents": self.get_total_unique_talents(),
             "directions_count": len(self.direction_assignments),
             "direction_assignments": {
                 direction: len(talents) 
@@ -179,62 +514,279 @@ class GlobalTalentManager:
         }
 
 
+# 可选：pyahocorasick 将关键词表编译为自动机，单次扫描完成全部子串匹配；
+# 未安装时退化为由关键词 trie 展开的单个正则（无额外依赖）
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+
+def _trie_pattern(keywords) -> str:
+    """将关键词构建为字符 trie，再展开为按公共前缀分组的正则（每个位置只需沿 trie 匹配一条路径）"""
+    trie: Dict[str, dict] = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # 终止标记
+    
+    def build(node: Dict[str, dict]) -> str:
+        # 子串匹配只需命中任一关键词：到达终止节点即可停止，无需继续匹配更长的关键词
+        if '' in node:
+            return ''
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    
+    return build(trie)
+
+
+def _build_keyword_matcher(keywords):
+    """构建子串匹配函数：text 包含任一关键词时返回 True"""
+    if HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    pattern = re.compile(_trie_pattern(keywords))
+    return lambda text: pattern.search(text) is not None
+
+
+# 排除明显不是人名的模式（_looks_like_person_name）
+_NON_PERSON_INDICATORS = (
+    'research', 'university', 'institute', 'center', 'lab', 'group',
+    'department', 'school', 'college', 'conference', 'workshop',
+    'journal', 'publication', 'paper', 'study', 'analysis',
+    'autonomous', 'artificial', 'machine', 'deep', 'neural',
+    'learning', 'intelligence', 'system', 'algorithm', 'method'
+)
+
+# 可疑指示器：名称中包含这些时需要LLM验证（_needs_llm_verification）
+_SUSPICIOUS_NAME_INDICATORS = (
+    # 技术术语在姓名中
+    'ai', 'ml', 'deep', 'neural', 'learning', 'intelligence', 'computing',
+    'research', 'system', 'method', 'model', 'algorithm', 'framework',
+    
+    # 标题中包含非个人指示器
+    'powered by', 'developed by', 'created by', 'team', 'group', 'lab',
+    'project', 'initiative', 'program', 'platform', 'tool', 'software',
+    
+    # 可疑的名称模式
+    'multimodal', 'autonomous', 'intelligent', 'smart', 'automated',
+    'cognitive', 'computational', 'analytical', 'predictive'
+)
+
+# 标题中的可疑模式
+_SUSPICIOUS_TITLE_PATTERNS = (
+    'powered', 'system', 'tool', 'platform', 'method', 'approach',
+    'framework', 'solution', 'technology', 'innovation', 'research group'
+)
+
+# 明显的非人名指示词（大幅扩展版本，参考targeted search；_is_valid_person_name）
+_NON_PERSON_KEYWORDS = frozenset({
+    # 研究机构和组织
+    'autonomous research', 'artificial intelligence', 'machine learning',
+    'deep learning', 'neural network', 'computer vision', 'natural language',
+    'data science', 'research center', 'research institute', 'research lab',
+    'research group', 'university', 'institute', 'center', 'laboratory',
+    'department', 'school', 'college', 'division', 'faculty', 'staff',
+    
+    # 技术和方法名称
+    'transformer', 'attention mechanism', 'reinforcement learning',
+    'supervised learning', 'unsupervised learning', 'federated learning',
+    'transfer learning', 'meta learning', 'few shot learning',
+    'zero shot learning', 'multi agent', 'multi-agent', 'neural networks',
+    'computer science', 'machine intelligence', 'robotics', 'nlp', 'cv',
+    
+    # 会议和期刊
+    'conference', 'workshop', 'symposium', 'journal', 'proceedings',
+    'transactions', 'letters', 'review', 'survey', 'lecture', 'seminar',
+    
+    # 项目和产品名称
+    'project', 'system', 'framework', 'platform', 'toolkit',
+    'library', 'package', 'software', 'application', 'solution',
+    'database', 'dataset', 'benchmark', 'corpus', 'api', 'tool',
+    
+    # 其他明显非人名
+    'research', 'study', 'analysis', 'evaluation', 'assessment',
+    'methodology', 'approach', 'technique', 'algorithm', 'model',
+    'tutorial', 'guide', 'documentation', 'manual', 'handbook',
+    'introduction', 'overview', 'news', 'article', 'blog', 'post',
+    
+    # 常见的错误匹配词汇（targeted search发现的）
+    'powered multimodal', 'member profiles', 'how to write',
+    'mobility after', 'specialty profiles', 'powered by',
+    'patient ai', 'profiles research', 'after ai',
+    'multimodal patient', 'write research', 'research institution',
+    'artificial general', 'computational biology', 'quantum computing',
+    'autonomous systems', 'intelligent systems', 'cognitive science',
+    
+    # 新增：更多常见非人名模式（来自targeted search的经验）
+    'startup', 'company', 'organization', 'foundation', 'society',
+    'collaboration', 'partnership', 'network', 'initiative', 'program',
+    'curriculum', 'course', 'training', 'education', 'teaching',
+    'publication', 'paper', 'thesis', 'dissertation', 'report',
+    'announcement', 'call for papers', 'submission', 'deadline',
+    'scientific', 'academic', 'technological', 'innovation',
+    'development', 'engineering', 'mathematics', 'statistics',
+    'dataset collection', 'data mining', 'big data', 'cloud computing',
+    'edge computing', 'blockchain', 'cryptocurrency', 'fintech',
+    'biotech', 'medtech', 'healthtech', 'edtech', 'cleantech',
+    
+    # 特定错误案例（基于实际观察）
+    'how to build', 'what is the', 'introduction to', 'overview of',
+    'a survey of', 'state of the art', 'cutting edge', 'breakthrough',
+    'novel approach', 'new method', 'latest research', 'recent advances',
+    'future directions', 'open challenges', 'current trends',
+})
+
+# _is_valid_person_name 使用的正则（模块加载时编译一次）
+_ACADEMIC_RE = re.compile(
+    r'\b(?:et\s+al|PhD|Professor|Research|Study|Analysis'
+    r'|Learning|Network|System|Method|Algorithm|Model'
+    r'|Conference|Workshop|Journal|Proceedings)\b',
+    re.IGNORECASE,
+)
+_DR_RE = re.compile(r'\bDr\.?\s*', re.IGNORECASE)
+
+
+class _NonWordDeleteTable(dict):
+    """str.translate 删除表：删除非 \\w 字符（等价于 re.sub(r'[^\\w]', '', s)），按需填充，只缓存出现过的字符"""
+    
+    def __missing__(self, codepoint: int):
+        value = codepoint if (chr(codepoint).isalnum() or codepoint == 0x5F) else None
+        self[codepoint] = value
+        return value
+
+
+_NONWORD_TABLE = _NonWordDeleteTable()
+
+# 姓名中的连接词（不要求首字母大写）
+_NAME_CONNECTORS = frozenset({'de', 'van', 'von', 'la', 'le', 'du', 'del', 'della', 'di'})
+
+_has_non_person_indicator = _build_keyword_matcher(_NON_PERSON_INDICATORS)
+_has_suspicious_name_indicator = _build_keyword_matcher(_SUSPICIOUS_NAME_INDICATORS)
+_has_suspicious_title_pattern = _build_keyword_matcher(_SUSPICIOUS_TITLE_PATTERNS)
+_has_non_person_keyword = _build_keyword_matcher(_NON_PERSON_KEYWORDS)
+
+
+# _format_candidate 读取的候选人字段；对象上不存在的字段不写入，由 .get() 的缺省值兜底（与 model_dump 行为一致）
+_CANDIDATE_FIELDS = (
+    'name', 'current_affiliation', 'current_role_affiliation',
+    'research_interests', 'research_keywords', 'research_focus',
+    'notable_papers', 'representative_papers', 'top_tier_hits', 'publication_overview',
+    'honors_grants', 'service_talks', 'open_source_projects',
+    'profiles', 'radar', 'total_score', 'detailed_scores',
+    'email', 'current_status', 'highlights',
+)
+
+
+def _title_key(talent: Dict[str, Any]) -> str:
+    """合并去重用的小写姓名：优先读取 _format_candidate 写入的 _title_lc"""
+    key = talent.get('_title_lc')
+    if key is None:
+        key = talent['_title_lc'] = (talent.get('title') or '').lower()
+    return key
+
+
+def _project_field(value):
+    """复制容器字段（不与缓存中的候选人对象共享），嵌套模型（如代表论文）转为字典，与 model_dump 输出一致"""
+    if isinstance(value, list):
+        return [item.model_dump() if hasattr(item, 'model_dump') else item for item in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
 class TrendTalentSearcher:
     """Trend Radar talent searcher"""
     
     def __init__(self):
         self.available = TALENT_SEARCH_AVAILABLE
         self.global_manager = GlobalTalentManager()  # 全局人才管理器
+        self._tb_emitted = set()  # 已输出过完整 traceback 的异常类型
+        self._tb_lock = threading.Lock()
         if not self.available:
             print("[WARNING] Talent search functionality unavailable - will return empty results")
     
-    def search_by_names(self, names: List[str], api_key: str = None, max_per_name: int = 1) -> List[Dict[str, Any]]:
+    def search_by_names(self, names: List[str], api_key: str = None, max_per_name: int = 1,
+                        force_refresh: bool = False) -> List[Dict[str, Any]]:
         """
         从推文获取的人才名字进行搜索
         跳过前期搜索步骤，直接从 OpenReview 等学术数据源开始构建 profile
+        各姓名并发搜索（I/O 密集），结果顺序与输入姓名一致
+        force_refresh=True 时忽略档案缓存重新搜索
         """
         if not self.available:
             print("Talent search功能不可用，返回空结果")
             return []
         
-        out = []
+        names = names[:max_per_name]
         print(f"开始按姓名搜索 {len(names)} 位人才...")
         print(f"搜索策略: 直接从学术数据源(OpenReview等)构建profile，跳过前期搜索")
-            
-        for name in names[:max_per_name]:
+        if not names:
+            return self._collect_name_results(names, [])
+        
+        # 各姓名在线程池中并发搜索（下游基于 requests，为阻塞调用）
+        with ThreadPoolExecutor(max_workers=min(SEARCH_CONCURRENCY, len(names)),
+                                thread_name_prefix="NameSearch") as executor:
+            futures = [executor.submit(self._search_single_name, name, api_key, force_refresh)
+                       for name in names]
+        results = []
+        for future in futures:
             try:
-                print(f"\n   正在搜索: {name}")
-
-                # 直接调用 orchestrate_candidate_report —— 跳过前期搜索步骤
-                from backend.trend_radar_search.author_discovery import orchestrate_candidate_report
-
-                profile, overview, eval_res = orchestrate_candidate_report(
-                    first_author=name,
-                    paper_title="",           # 没有论文标题
-                    paper_url=None,
-                    aliases=[],               # 没有别名
-                    k_queries=10,             # 适度的查询数量
-                    author_id=None,
-                    api_key=api_key,
-                    use_lightweight_mode=True  # 使用轻量级模式，提高速度
-                )
-
-                # 完全信任 Targeted Search 的内部过滤逻辑
-                if overview is None:
-                    print(f"{name} 未找到OpenReview档案（已被Targeted Search内部过滤）")
-                    continue
-
-                formatted = self._format_candidate(overview, name)
-
+                results.append(future.result())
             except Exception as e:
-                print(f"{name} 搜索失败: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
+                results.append(e)
+        return self._collect_name_results(names, results)
+    
+    def _collect_name_results(self, names: List[str], results: List[Any]) -> List[Dict[str, Any]]:
+        """按输入顺序汇总各姓名的搜索结果，记录异常"""
+        out = []
+        for name, r in zip(names, results):
+            if isinstance(r, BaseException):
+                self._log_search_error(f"{name} 搜索异常", r)
+            elif r:
+                out.append(r)
         
         print(f"\n姓名搜索完成，找到 {len(out)} 位合格人才")
         return out
     
+    def _search_single_name(self, name: str, api_key: str = None, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """搜索单个姓名并格式化，未找到或失败时返回 None"""
+        try:
+            print(f"\n   正在搜索: {name}")
+
+            # 直接调用 orchestrate_candidate_report（带缓存）—— 跳过前期搜索步骤
+            # 使用轻量级模式，提高速度
+            profile, overview, eval_res = _cached_orchestrate(
+                name, paper_url=None, lightweight=True,
+                api_key=api_key, force_refresh=force_refresh
+            )
+
+            # 完全信任 Targeted Search 的内部过滤逻辑
+            if overview is None:
+                print(f"{name} 未找到OpenReview档案（已被Targeted Search内部过滤）")
+                return None
+
+            return self._format_candidate(overview, name)
+
+        except _SEARCH_ERRORS as e:
+            self._log_search_error(f"{name} 搜索失败", e)
+            return None
+    
+    def _log_search_error(self, message: str, exc: BaseException) -> None:
+        """记录搜索失败：同一异常类型每次运行只输出一次完整 traceback，其余只记一行"""
+        with self._tb_lock:
+            first = type(exc) not in self._tb_emitted
+            self._tb_emitted.add(type(exc))
+        if first:
+            logger.error("%s: %s", message, exc, exc_info=exc)
+        else:
+            logger.warning("%s: %s", message, exc)
+    
     def search_talents_for_direction(self, 
                                     direction_title: str,
                                     direction_content: str = "",
@@ -282,69 +834,105 @@ class TrendTalentSearcher:
 
             # 不额外评分过滤，完全信任 Targeted Search 的排序结果
             # Targeted Search 内部已经过滤和排序，recommended_candidates 就是最佳结果
-            formatted = []
-            for c in cand_list:
-                candidate = self._format_candidate(c, direction_title)
-                if candidate:
-                    formatted.append(candidate)
-                    print(f"      {c.name}")
-                    print(f"      评分: {c.total_score}/35")
-                    print(f"      机构: {c.current_role_affiliation or 'Unknown'}")
-
-            # 全局去重（使用 GlobalTalentManager）
+            # 先按姓名/邮箱查重，只格式化人才池中尚不存在的候选人；
+            # 凑够本轮所需人数即停止格式化，批内重复导致不足时再从剩余候选中补齐
             assigned = []
-            for f in formatted:
-                if len(assigned) >= max_candidates:
+            remaining = iter(cand_list)
+            while len(assigned) < max_candidates:
+                need = max_candidates - len(assigned)
+                formatted = []
+                for c in remaining:
+                    if not self.global_manager.would_accept(c.name, getattr(c, 'email', '')):
+                        print(f"      {c.name} 已在其他方向分配，跳过")
+                        continue
+                    candidate = self._format_candidate(c, direction_title)
+                    if candidate:
+                        formatted.append(candidate)
+                        print(f"      {c.name}")
+                        print(f"      评分: {c.total_score}/35")
+                        print(f"      机构: {c.current_role_affiliation or 'Unknown'}")
+                        if len(formatted) >= need:
+                            break
+                if not formatted:
                     break
-                if self.global_manager.add_talent_to_direction(f, direction_title):
-                    assigned.append(f)
+                
+                # 全局去重（使用 GlobalTalentManager，整批一次性打分）
+                assigned.extend(self.global_manager.add_talents_to_direction(
+                    formatted, direction_title, limit=need
+                ))
             
             print(f"[Direction Search] '{direction_title}' final assignment: {len(assigned)} talents")
             return assigned
             
+        except _SEARCH_ERRORS as e:
+            self._log_search_error(f"[Direction Search] '{direction_title}' failed", e)
+            return []
         except Exception as e:
-            print(f"[Direction Search] Failed: {e}")
-            import traceback
-            traceback.print_exc()
+            # 兜底：LLM 客户端错误、响应缺字段等非网络异常同样只让本方向的网络层结果为空，
+            # 不能冒泡到 Stage 2 把已找到的推文层人才一并丢掉
+            self._log_search_error(f"[Direction Search] '{direction_title}' failed unexpectedly", e)
             return []
+
+
+    def search_talents_for_multiple_directions(self, directions: List[Dict[str, str]],
+                                               max_candidates_per_direction: int = 3,
+                                               api_key: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        并发搜索多个方向的人才（带全局去重）
+        
+        Args:
+            directions: [{'title': ..., 'content': ...}, ...]
+        
+        Returns:
+            {direction_title: [talent, ...]}，按输入方向顺序
+        """
+        titles = [d.get('title', '') for d in directions]
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="DirectionSearch") as executor:
+            futures = {
+                executor.submit(self.search_talents_for_direction, d.get('title', ''),
+                                d.get('content', ''), max_candidates_per_direction, api_key): title
+                for d, title in zip(directions, titles)
+            }
+            for future, title in futures.items():
+                try:
+                    results[title] = future.result()
+                except Exception as e:
+                    self._log_search_error(f"[Direction Search] '{title}' failed", e)
+                    results[title] = []
+        
+        # GlobalTalentManager 已在插入时去重；按方向顺序再过一遍，保证同一姓名只出现在最先的方向
+        seen_titles = set()
+        batch = {}
+        for title in titles:
+            unique = []
+            for talent in results.get(title, []):
+                key = _title_key(talent)
+                if key not in seen_titles:
+                    seen_titles.add(key)
+                    unique.append(talent)
+            batch[title] = unique
+        return batch
+    
+    def get_talent_statistics(self) -> Dict[str, Any]:
+        """全局人才池统计"""
+        return self.global_manager.get_stats()
     
+    def reset_talent_manager(self) -> None:
+        """清空全局人才池，下次搜索从空池开始"""
+        self.global_manager.reset()
     
     def _format_candidate(self, candidate: 'CandidateOverview', direction_title: str) -> Dict[str, Any]:
         """格式化候选人数据"""
         try:
-            # 转换为字典 - 兼容 Pydantic 和 dataclass
-            if hasattr(candidate, 'model_dump'):
-                # Pydantic v2
-                candidate_dict = candidate.model_dump()
-            elif hasattr(candidate, 'dict'):
-                # Pydantic v1
-                candidate_dict = candidate.dict()
-            elif hasattr(candidate, '__dataclass_fields__'):
-                # dataclass
+            # 转换为字典 - dataclass 直接 asdict；Pydantic 模型及其他对象只读取用到的字段，
+            # 避免 model_dump() 序列化整个模型
+            if hasattr(candidate, '__dataclass_fields__'):
                 candidate_dict = asdict(candidate)
             else:
-                # 直接访问属性
                 candidate_dict = {
-                    'name': getattr(candidate, 'name', 'Unknown'),
-                    'current_affiliation': getattr(candidate, 'current_affiliation', ''),
-                    'current_role_affiliation': getattr(candidate, 'current_role_affiliation', ''),
-                    'research_interests': getattr(candidate, 'research_interests', []),
-                    'research_keywords': getattr(candidate, 'research_keywords', []),
-                    'research_focus': getattr(candidate, 'research_focus', []),
-                    'notable_papers': getattr(candidate, 'notable_papers', []),
-                    'representative_papers': getattr(candidate, 'representative_papers', []),
-                    'top_tier_hits': getattr(candidate, 'top_tier_hits', []),
-                    'publication_overview': getattr(candidate, 'publication_overview', []),
-                    'honors_grants': getattr(candidate, 'honors_grants', []),
-                    'service_talks': getattr(candidate, 'service_talks', []),
-                    'open_source_projects': getattr(candidate, 'open_source_projects', []),
-                    'profiles': getattr(candidate, 'profiles', {}),
-                    'radar': getattr(candidate, 'radar', {}),
-                    'total_score': getattr(candidate, 'total_score', 0),
-                    'detailed_scores': getattr(candidate, 'detailed_scores', {}),
-                    'email': getattr(candidate, 'email', ''),
-                    'current_status': getattr(candidate, 'current_status', ''),
-                    'highlights': getattr(candidate, 'highlights', []),
+                    field: _project_field(getattr(candidate, field))
+                    for field in _CANDIDATE_FIELDS if hasattr(candidate, field)
                 }
             
             # 提取关键信息
@@ -358,8 +946,8 @@ class TrendTalentSearcher:
             
             description_parts = []
             
-            # 研究兴趣和关键词
-            all_interests = list(set(research_interests + research_keywords + research_focus))
+            # 研究兴趣和关键词（单次遍历去重，保持原始顺序）
+            all_interests = list(dict.fromkeys(chain(research_interests, research_keywords, research_focus)))
             if all_interests:
                 description_parts.append(f"Research focus: {', '.join(all_interests[:5])}")
             
@@ -368,9 +956,8 @@ class TrendTalentSearcher:
             representative_papers = candidate_dict.get('representative_papers', [])
             top_tier_hits = candidate_dict.get('top_tier_hits', [])
             
-            all_papers = notable_papers + representative_papers + top_tier_hits
-            if all_papers:
-                paper_count = len(all_papers)
+            paper_count = len(notable_papers) + len(representative_papers) + len(top_tier_hits)
+            if paper_count:
                 description_parts.append(f"Academic output: {paper_count} notable publications")
                 
                 # 如果有顶级期刊/会议论文，特别标注
@@ -448,8 +1035,8 @@ class TrendTalentSearcher:
                         highlight_parts.append(f"Published {venue_count} papers in top-tier conferences/journals")
                     else:
                         highlight_parts.append("Published in top-tier academic venues")
-                elif all_papers:
-                    highlight_parts.append(f"Author of {len(all_papers)} research publications")
+                elif paper_count:
+                    highlight_parts.append(f"Author of {paper_count} research publications")
                 
                 # 学术荣誉亮点
                 if honors_grants:
@@ -490,17 +1077,23 @@ class TrendTalentSearcher:
             # 补充缺失的研究状态信息
             current_status = candidate_dict.get('current_status', '')
             if not current_status:
-                if 'phd' in description.lower() or 'doctoral' in description.lower():
-                    current_status = 'PhD Candidate'
-                elif 'professor' in current_affiliation.lower() or 'prof' in current_affiliation.lower():
-                    current_status = 'Professor'
-                elif 'postdoc' in description.lower() or 'postdoctoral' in description.lower():
-                    current_status = 'Postdoctoral Researcher'
+                desc_lower = description.lower()
+                aff_lower = current_affiliation.lower()
+                # 按优先级匹配（'prof' 覆盖 'professor'，'postdoc' 覆盖 'postdoctoral'）
+                for keywords, text, status in (
+                    (('phd', 'doctoral'), desc_lower, 'PhD Candidate'),
+                    (('prof',), aff_lower, 'Professor'),
+                    (('postdoc',), desc_lower, 'Postdoctoral Researcher'),
+                ):
+                    if any(kw in text for kw in keywords):
+                        current_status = status
+                        break
                 else:
                     current_status = 'Researcher'
 
             return {
                 'title': name,
+                '_title_lc': (name or '').lower(),  # 合并去重用的小写姓名，只在构建时计算一次
                 'content': description,
                 'affiliation': current_affiliation,
                 'status': current_status,
@@ -536,19 +1129,6 @@ class TrendTalentSearcher:
         if not name or len(name) < 3:
             return False
         
-        # 排除明显不是人名的模式
-        non_person_indicators = [
-            'research', 'university', 'institute', 'center', 'lab', 'group',
-            'department', 'school', 'college', 'conference', 'workshop',
-            'journal', 'publication', 'paper', 'study', 'analysis',
-            'autonomous', 'artificial', 'machine', 'deep', 'neural',
-            'learning', 'intelligence', 'system', 'algorithm', 'method'
-        ]
-        
-        name_lower = name.lower()
-        if any(indicator in name_lower for indicator in non_person_indicators):
-            return False
-        
         # 检查是否包含典型的人名词汇
         words = name.split()
         if len(words) < 2 or len(words) > 4:
@@ -561,17 +1141,26 @@ class TrendTalentSearcher:
             if len(word) < 2:
                 return False
         
+        # 排除明显不是人名的模式（结构检查通过后才生成小写副本做关键词扫描）
+        if _has_non_person_indicator(name.lower()):
+            return False
+        
         return True
     
     def _llm_verify_person_name(self, name: str, snippet: str = "", api_key: str = None) -> bool:
         """
         使用LLM验证姓名是否为真实人名（参考targeted search逻辑）
+        结论按姓名缓存；LLM 失败时短期负缓存并回退到规则验证
         """
+        # 如果姓名明显不是人名，跳过LLM验证以节省token
+        if not self._is_valid_person_name(name):
+            return False
+        
+        cached, verdict = _get_name_verdict(name)
+        if cached:
+            return verdict if verdict is not None else self._is_valid_person_name(name)
+        
         try:
-            # 如果姓名明显不是人名，跳过LLM验证以节省token
-            if not self._is_valid_person_name(name):
-                return False
-            
             # 构建验证prompt
             prompt = f"""You are a strict name validator. Determine if the following is a REAL PERSON'S NAME (not a concept, organization, or technology).
             Target Name: "{name}"
@@ -587,17 +1176,20 @@ class TrendTalentSearcher:
             Is "{name}" a real person's name?
             Respond with only: YES or NO"""
 
-            from backend import llm as llm_utils
             llm = llm_utils.get_llm(role="talent_verification", temperature=0.1, api_key=api_key)
             response = llm.invoke(prompt, enable_thinking=False)
+            text = llm_utils.safe_get_text(response, "content", "text").strip().upper()
             
-            if response and isinstance(response, str):
-                return response.strip().upper() == "YES"
+            if text in ("YES", "NO"):
+                verdict = text == "YES"
+                _set_name_verdict(name, verdict)
+                return verdict
             
         except Exception as e:
             print(f"[LLM验证] 验证姓名 '{name}' 失败: {e}")
         
         # 如果LLM验证失败，回退到传统验证
+        _set_name_verdict(name, None)
         return self._is_valid_person_name(name)
     
     def _needs_llm_verification(self, name: str, title: str, snippet: str) -> bool:
@@ -609,35 +1201,13 @@ class TrendTalentSearcher:
         title_lower = title.lower()
         snippet_lower = snippet.lower()
         
-        # 可疑指示器：如果包含这些，需要LLM验证
-        suspicious_indicators = [
-            # 技术术语在姓名中
-            'ai', 'ml', 'deep', 'neural', 'learning', 'intelligence', 'computing',
-            'research', 'system', 'method', 'model', 'algorithm', 'framework',
-            
-            # 标题中包含非个人指示器
-            'powered by', 'developed by', 'created by', 'team', 'group', 'lab',
-            'project', 'initiative', 'program', 'platform', 'tool', 'software',
-            
-            # 可疑的名称模式
-            'multimodal', 'autonomous', 'intelligent', 'smart', 'automated',
-            'cognitive', 'computational', 'analytical', 'predictive'
-        ]
-        
         # 检查名称本身是否包含可疑指示器
-        for indicator in suspicious_indicators:
-            if indicator in name_lower:
-                return True
+        if _has_suspicious_name_indicator(name_lower):
+            return True
         
         # 检查标题是否包含可疑模式但名称看起来可能是人名
-        title_suspicious_patterns = [
-            'powered', 'system', 'tool', 'platform', 'method', 'approach',
-            'framework', 'solution', 'technology', 'innovation', 'research group'
-        ]
-        
-        for pattern in title_suspicious_patterns:
-            if pattern in title_lower:
-                return True
+        if _has_suspicious_title_pattern(title_lower):
+            return True
         
         # 检查URL是否指向非个人页面
         # 这里可以添加URL检查逻辑
@@ -656,93 +1226,33 @@ class TrendTalentSearcher:
         # 默认不需要LLM验证（节省token）
         return False
     
-    def _is_valid_person_name(self, name: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_valid_person_name(name: str) -> bool:
         """
         严格验证是否为有效的人名
+        纯函数（只依赖模块级关键词表/正则），结果按姓名缓存：重复出现的候选姓名直接命中
         """
         if not name or len(name.strip()) < 3:
             return False
         
         name = name.strip()
         
-        # 定义明显的非人名指示词（大幅扩展版本，参考targeted search）
-        non_person_keywords = {
-            # 研究机构和组织
-            'autonomous research', 'artificial intelligence', 'machine learning',
-            'deep learning', 'neural network', 'computer vision', 'natural language',
-            'data science', 'research center', 'research institute', 'research lab',
-            'research group', 'university', 'institute', 'center', 'laboratory',
-            'department', 'school', 'college', 'division', 'faculty', 'staff',
-            
-            # 技术和方法名称
-            'transformer', 'attention mechanism', 'reinforcement learning',
-            'supervised learning', 'unsupervised learning', 'federated learning',
-            'transfer learning', 'meta learning', 'few shot learning',
-            'zero shot learning', 'multi agent', 'multi-agent', 'neural networks',
-            'computer science', 'machine intelligence', 'robotics', 'nlp', 'cv',
-            
-            # 会议和期刊
-            'conference', 'workshop', 'symposium', 'journal', 'proceedings',
-            'transactions', 'letters', 'review', 'survey', 'lecture', 'seminar',
-            
-            # 项目和产品名称
-            'project', 'system', 'framework', 'platform', 'toolkit',
-            'library', 'package', 'software', 'application', 'solution',
-            'database', 'dataset', 'benchmark', 'corpus', 'api', 'tool',
-            
-            # 其他明显非人名
-            'research', 'study', 'analysis', 'evaluation', 'assessment',
-            'methodology', 'approach', 'technique', 'algorithm', 'model',
-            'tutorial', 'guide', 'documentation', 'manual', 'handbook',
-            'introduction', 'overview', 'news', 'article', 'blog', 'post',
-            
-            # 常见的错误匹配词汇（targeted search发现的）
-            'powered multimodal', 'member profiles', 'how to write',
-            'mobility after', 'specialty profiles', 'powered by',
-            'patient ai', 'profiles research', 'after ai',
-            'multimodal patient', 'write research', 'research institution',
-            'artificial general', 'computational biology', 'quantum computing',
-            'autonomous systems', 'intelligent systems', 'cognitive science',
-            
-            # 新增：更多常见非人名模式（来自targeted search的经验）
-            'startup', 'company', 'organization', 'foundation', 'society',
-            'collaboration', 'partnership', 'network', 'initiative', 'program',
-            'curriculum', 'course', 'training', 'education', 'teaching',
-            'publication', 'paper', 'thesis', 'dissertation', 'report',
-            'announcement', 'call for papers', 'submission', 'deadline',
-            'scientific', 'academic', 'technological', 'innovation',
-            'development', 'engineering', 'mathematics', 'statistics',
-            'dataset collection', 'data mining', 'big data', 'cloud computing',
-            'edge computing', 'blockchain', 'cryptocurrency', 'fintech',
-            'biotech', 'medtech', 'healthtech', 'edtech', 'cleantech',
-            
-            # 特定错误案例（基于实际观察）
-            'how to build', 'what is the', 'introduction to', 'overview of',
-            'a survey of', 'state of the art', 'cutting edge', 'breakthrough',
-            'novel approach', 'new method', 'latest research', 'recent advances',
-            'future directions', 'open challenges', 'current trends',
-        }
-        
-        name_lower = name.lower()
-        
-        # 检查是否包含明显的非人名关键词
-        if any(keyword in name_lower for keyword in non_person_keywords):
+        # 先做廉价的结构检查，不合格的输入无需进入关键词扫描
+        # 检查单词数量（人名通常是2-4个单词）
+        words = name.split()
+        if len(words) < 2 or len(words) > 4:
             return False
         
         # 检查是否为全大写（通常不是人名）
         if name.isupper() and len(name) > 10:
             return False
         
-        # 检查单词数量（人名通常是2-4个单词）
-        words = name.split()
-        if len(words) < 2 or len(words) > 4:
-            return False
-        
         # 检查每个单词是否符合人名格式
         valid_name_words = 0
         for word in words:
             # 去除标点符号
-            clean_word = re.sub(r'[^\w]', '', word)
+            clean_word = word.translate(_NONWORD_TABLE)
             
             if not clean_word:
                 continue
@@ -751,16 +1261,17 @@ class TrendTalentSearcher:
             if len(clean_word) < 2 or len(clean_word) > 15:
                 return False
             
-            # 检查是否包含数字（人名通常不包含数字）
-            if any(c.isdigit() for c in clean_word):
+            # 只允许字母（排除数字、下划线等，人名通常不包含数字）
+            if not clean_word.isalpha():
                 return False
             
             # 检查首字母大写（除了连接词）
-            if clean_word.lower() not in ['de', 'van', 'von', 'la', 'le', 'du', 'del', 'della', 'di']:
+            if clean_word.lower() not in _NAME_CONNECTORS:
                 if not clean_word[0].isupper():
                     return False
                 # 检查是否有小写字母（避免全大写的缩写词）
-                if not any(c.islower() for c in clean_word[1:]):
+                rest = clean_word[1:]
+                if rest == rest.upper():
                     return False
                 valid_name_words += 1
         
@@ -768,25 +1279,36 @@ class TrendTalentSearcher:
         if valid_name_words < 2:
             return False
         
-        # 额外检查：是否包含常见的学术术语模式（排除常见的人名前缀）
-        academic_patterns = [
-            r'\b(?:et\s+al|PhD|Professor|Research|Study|Analysis)\b',
-            r'\b(?:Learning|Network|System|Method|Algorithm|Model)\b',
-            r'\b(?:Conference|Workshop|Journal|Proceedings)\b'
-        ]
+        # 检查是否包含明显的非人名关键词
+        if _has_non_person_keyword(name.lower()):
+            return False
         
+        # 额外检查：是否包含常见的学术术语模式（排除常见的人名前缀）
         # 允许Dr.作为人名前缀，但排除其他学术术语
-        name_without_dr = re.sub(r'\bDr\.?\s*', '', name, flags=re.IGNORECASE)
-        for pattern in academic_patterns:
-            if re.search(pattern, name_without_dr, re.IGNORECASE):
-                return False
+        name_without_dr = _DR_RE.sub('', name)
+        if _ACADEMIC_RE.search(name_without_dr):
+            return False
         
         return True
     
     
 
-# 全局实例
-trend_talent_searcher = TrendTalentSearcher()
+# search_talents_with_fallback 的目标人数：姓名搜索不足时由方向搜索补齐
+MIN_TALENTS = 3
+
+# 全局实例：首次使用时创建（导入模块时不加载人才池状态、不打印可用性警告）
+_trend_talent_searcher: Optional[TrendTalentSearcher] = None
+_trend_talent_searcher_lock = threading.Lock()
+
+
+def _get_searcher() -> TrendTalentSearcher:
+    """返回全局 TrendTalentSearcher（线程安全的延迟初始化）"""
+    global _trend_talent_searcher
+    if _trend_talent_searcher is None:
+        with _trend_talent_searcher_lock:
+            if _trend_talent_searcher is None:
+                _trend_talent_searcher = TrendTalentSearcher()
+    return _trend_talent_searcher
 
 # ==================== 便捷函数（模块导出接口） ====================
 
@@ -795,13 +1317,15 @@ def search_talents_for_direction(direction_title: str,
                                max_candidates: int = 3,
                                api_key: str = None) -> List[Dict[str, Any]]:
     """为研究方向搜索人才的便捷函数"""
-    return trend_talent_searcher.search_talents_for_direction(
+    return _get_searcher().search_talents_for_direction(
         direction_title, direction_content, max_candidates, api_key
     )
 
-def search_talents_by_names(names: List[str], max_per_name: int = 1, api_key: str = None) -> List[Dict[str, Any]]:
+def search_talents_by_names(names: List[str], max_per_name: int = 1, api_key: str = None,
+                            force_refresh: bool = False) -> List[Dict[str, Any]]:
     """根据姓名列表搜索人才的便捷函数"""
-    return trend_talent_searcher.search_by_names(names, api_key=api_key, max_per_name=max_per_name)
+    return _get_searcher().search_by_names(names, api_key=api_key, max_per_name=max_per_name,
+                                                 force_refresh=force_refresh)
 
 def search_talents_with_fallback(generated_names: List[str], 
                                 direction_title: str,
@@ -819,28 +1343,36 @@ def search_talents_with_fallback(generated_names: List[str],
     Returns:
         人才列表
     """
-    # 先按姓名搜索
-    talents_from_names = trend_talent_searcher.search_by_names(
-        names=generated_names,
-        api_key=api_key,
-        max_per_name=len(generated_names)
-    )
+    # 先按姓名搜索（去除重复/空姓名，保持原始顺序，避免重复的远程搜索）
+    searcher = _get_searcher()
+    names = [n for n in dict.fromkeys(generated_names) if n and n.strip()]
+    talents_from_names = []
+    if names:
+        talents_from_names = searcher.search_by_names(
+            names=names,
+            api_key=api_key,
+            max_per_name=len(names)
+        )
     
-    # 如果不足3个，用方向搜索补齐
-    if len(talents_from_names) < 3:
-        needed = 3 - len(talents_from_names)
-        talents_from_direction = trend_talent_searcher.search_talents_for_direction(
+    # 如果不足 MIN_TALENTS 个，用方向搜索补齐
+    needed = MIN_TALENTS - len(talents_from_names)
+    if needed > 0:
+        talents_from_direction = searcher.search_talents_for_direction(
             direction_title=direction_title,
             direction_content=direction_content,
             max_candidates=needed,
             api_key=api_key
         )
+        if not talents_from_names:
+            return talents_from_direction
         
-        # 合并并去重
-        existing_names = {t.get('title', '').lower() for t in talents_from_names}
+        # 合并并去重（新加入的姓名同样记入集合，方向结果内部的重复也一并排除）
+        existing_names = {_title_key(t) for t in talents_from_names}
         for talent in talents_from_direction:
-            if talent.get('title', '').lower() not in existing_names:
+            key = _title_key(talent)
+            if key and key not in existing_names:
                 talents_from_names.append(talent)
+                existing_names.add(key)
     
     return talents_from_names
 
@@ -848,14 +1380,14 @@ def search_talents_for_multiple_directions(directions: List[Dict[str, str]],
                                          max_candidates_per_direction: int = 3,
                                          api_key: str = None) -> Dict[str, List[Dict[str, Any]]]:
     """批量搜索多个方向人才的便捷函数（带全局去重）"""
-    return trend_talent_searcher.search_talents_for_multiple_directions(
+    return _get_searcher().search_talents_for_multiple_directions(
         directions, max_candidates_per_direction, api_key
     )
 
 def get_talent_statistics() -> Dict[str, Any]:
     """获取人才搜索统计信息的便捷函数"""
-    return trend_talent_searcher.get_talent_statistics()
+    return _get_searcher().get_talent_statistics()
 
 def reset_talent_search_session():
     """重置人才搜索会话的便捷函数"""
-    trend_talent_searcher.reset_talent_manager()
\ No newline at end of file
+    _get_searcher().reset_talent_manager()
\ No newline at end of file
@@ -1,254 +1,329 @@
 import streamlit as st
-import json
-import pandas as pd
-import plotly.graph_objects as go
 import html as _html
+import functools
+import hashlib
+import heapq
+import pickle
+import string
+from collections import Counter, namedtuple
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 import sys
 import time
 import os
-import textwrap
-
-# Import the backend module
-try:
-    from backend.reports import build_achievement_report, generate_group_achievement_report
-    from backend.report_storage import save_achievement_report, load_achievement_reports, delete_report, get_storage_stats
-    backend_available = True
-except ImportError as e:
-    print(f"Achievement Report ImportError: {e}")
-    backend_available = False
-
-# Default groups data
-DEFAULT_GROUPS = {
-    "recommend_research_group": {
-        "name": "Recommend Research Group",
-        "storage_type": "recommend_research_group",  # Storage directory mapping
-        "members": [
-            {
-                "name": "Lexin Zhou",
-                "homepage": "https://lexzhou.github.io/",
-                "affiliation": "1st-year CS PhD candidate at Princeton University, advised by Prof. Peter Henderson at the POLARIS Lab"
-            },
-            {
-                "name": "Zhongzhi Li",
-                "homepage": "https://zzli2022.github.io/",
-                "affiliation": "Researcher in Artificial Intelligence"
-            },
-            {
-                "name": "Ziming Liu",
-                "homepage": "https://kindxiaoming.github.io/",
-                "affiliation": "Postdoc at Stanford & Enigma, working with Prof. Andreas Tolias; PhD from MIT advised by Prof. Max Tegmark"
-            },
-        ],
-        "description": "Researchers working on AI, computational social science, NLP, and agent simulation",
-        "color": "#92ac2e"
-    },
-    "demo_research_group": {
-        "name": "MSRA former interns",
-        "storage_type": "msra_former_interns",  # Storage directory mapping
-        "members": [
-            {
-                "name": "Lexin Zhou",
-                "homepage": "https://lexzhou.github.io/",
-                "affiliation": "1st-year CS PhD candidate at Princeton University, advised by Prof. Peter Henderson at the POLARIS Lab"
-            },
-            {
-                "name": "Zhongzhi Li",
-                "homepage": "https://zzli2022.github.io/",
-                "affiliation": "Researcher in Artificial Intelligence"
-            },
-            {
-                "name": "Ziming Liu",
-                "homepage": "https://kindxiaoming.github.io/",
-                "affiliation": "Postdoc at Stanford & Enigma, working with Prof. Andreas Tolias; PhD from MIT advised by Prof. Max Tegmark"
-            },
-            {
-                "name": "Jinsook Lee",
-                "homepage": "https://jinsook-jennie-lee.github.io/",
-                "affiliation": "Ph.D. candidate, Information Science, Cornell University"
-            },
-            {
-                "name": "Zengqing Wu",
-                "homepage": "https://wuzengqing001225.github.io/",
-                "affiliation": "Master's student, Graduate School of Informatics, Kyoto University; Research Associate, Osaka University"
-            },
-            {
-                "name": "Xinyi Mou",
-                "homepage": "https://xymou.github.io/",
-                "affiliation": "Ph.D. student, Fudan University (Data Intelligence and Social Computing Lab)"
-            },
-            {
-                "name": "Jiarui Ji",
-                "homepage": "https://ji-cather.github.io/homepage/",
-                "affiliation": "M.E. student, Gaoling School of Artificial Intelligence, Renmin University of China"
-            }
-        ],
-        "description": "Researchers working on AI, computational social science, NLP, and agent simulation",
-        "color": "#4facfe"
-    },
-    "StartTrack": {
-        "name": "StartTrack Group",
-        "storage_type": "starttrack_group",  # Storage directory mapping
-        "members": [
-            {
-                "name": "Lexin Zhou",
-                "homepage": "https://lexzhou.github.io/",
-                "affiliation": "1st-year CS PhD candidate at Princeton University, advised by Prof. Peter Henderson at the POLARIS Lab"
-            },
-            {
-                "name": "Ziming Liu",
-                "homepage": "https://kindxiaoming.github.io/",
-                "affiliation": "Postdoc at Stanford & Enigma, working with Prof. Andreas Tolias; PhD from MIT advised by Prof. Max Tegmark"
-            },
-        ],
-        "description": "Researchers working on AI, computational social science, NLP, and agent simulation",
-        "color": "#3fac3e"
-    }
+
+_Backend = namedtuple(
+    "_Backend",
+    "generate_group_achievement_report save_achievement_report load_achievement_reports "
+    "iter_achievement_reports achievement_reports_version scan_achievement_reports load_achievement_report_file "
+    "delete_report get_latest_achievement_report_time",
+)
+
+
+# Import the backend module on first use so the groups page doesn't pay for it
+@functools.cache
+def _get_backend():
+    """Return the report backend functions, or None if the backend is unavailable"""
+    try:
+        from backend.reports import generate_group_achievement_report
+        from backend.report_storage import (
+            save_achievement_report, load_achievement_reports, iter_achievement_reports,
+            achievement_reports_version, scan_achievement_reports, load_achievement_report_file,
+            delete_report, get_latest_achievement_report_time,
+        )
+    except ImportError as e:
+        print(f"Achievement Report ImportError: {e}")
+        return None
+    return _Backend(generate_group_achievement_report, save_achievement_report, load_achievement_reports,
+                    iter_achievement_reports, achievement_reports_version, scan_achievement_reports,
+                    load_achievement_report_file, delete_report, get_latest_achievement_report_time)
+
+# Default members, shared by reference between the default groups below
+_MEMBERS = {
+    "lexin": MappingProxyType({
+        "name": "Lexin Zhou",
+        "homepage": "https://lexzhou.github.io/",
+        "affiliation": "1st-year CS PhD candidate at Princeton University, advised by Prof. Peter Henderson at the POLARIS Lab"
+    }),
+    "zhongzhi": MappingProxyType({
+        "name": "Zhongzhi Li",
+        "homepage": "https://zzli2022.github.io/",
+        "affiliation": "Researcher in Artificial Intelligence"
+    }),
+    "ziming": MappingProxyType({
+        "name": "Ziming Liu",
+        "homepage": "https://kindxiaoming.github.io/",
+        "affiliation": "Postdoc at Stanford & Enigma, working with Prof. Andreas Tolias; PhD from MIT advised by Prof. Max Tegmark"
+    }),
+    "jinsook": MappingProxyType({
+        "name": "Jinsook Lee",
+        "homepage": "https://jinsook-jennie-lee.github.io/",
+        "affiliation": "Ph.D. candidate, Information Science, Cornell University"
+    }),
+    "zengqing": MappingProxyType({
+        "name": "Zengqing Wu",
+        "homepage": "https://wuzengqing001225.github.io/",
+        "affiliation": "Master's student, Graduate School of Informatics, Kyoto University; Research Associate, Osaka University"
+    }),
+    "xinyi": MappingProxyType({
+        "name": "Xinyi Mou",
+        "homepage": "https://xymou.github.io/",
+        "affiliation": "Ph.D. student, Fudan University (Data Intelligence and Social Computing Lab)"
+    }),
+    "jiarui": MappingProxyType({
+        "name": "Jiarui Ji",
+        "homepage": "https://ji-cather.github.io/homepage/",
+        "affiliation": "M.E. student, Gaoling School of Artificial Intelligence, Renmin University of China"
+    }),
 }
 
+
+# Default groups data, built once per process and shared read-only across sessions
+@st.cache_resource
+def _default_groups_frozen():
+    return MappingProxyType({
+        "recommend_research_group": {
+            "name": "Recommend Research Group",
+            "storage_type": "recommend_research_group",  # Storage directory mapping
+            "members": [
+                _MEMBERS["lexin"],
+                _MEMBERS["zhongzhi"],
+                _MEMBERS["ziming"],
+            ],
+            "description": "Researchers working on AI, computational social science, NLP, and agent simulation",
+            "color": "#92ac2e"
+        },
+        "demo_research_group": {
+            "name": "MSRA former interns",
+            "storage_type": "msra_former_interns",  # Storage directory mapping
+            "members": [
+                _MEMBERS["lexin"],
+                _MEMBERS["zhongzhi"],
+                _MEMBERS["ziming"],
+                _MEMBERS["jinsook"],
+                _MEMBERS["zengqing"],
+                _MEMBERS["xinyi"],
+                _MEMBERS["jiarui"],
+            ],
+            "description": "Researchers working on AI, computational social science, NLP, and agent simulation",
+            "color": "#4facfe"
+        },
+        "StartTrack": {
+            "name": "StartTrack Group",
+            "storage_type": "starttrack_group",  # Storage directory mapping
+            "members": [
+                _MEMBERS["lexin"],
+                _MEMBERS["ziming"],
+            ],
+            "description": "Researchers working on AI, computational social science, NLP, and agent simulation",
+            "color": "#3fac3e"
+        }
+    })
+
+# Group id -> report storage directory
+_GROUP_TYPE_MAPPING = MappingProxyType({
+    "recommend_research_group": "recommend_research_group",
+    "demo_research_group": "msra_former_interns",  # MSRA former interns
+    "StartTrack": "starttrack_group"  # 正确的组ID映射
+})
+
+def _maybe_rerun(target):
+    """Switch to a sub-page and rerun, unless it is already the current one"""
+    if st.session_state.get("current_page") != target:
+        st.session_state.current_page = target
+        st.session_state.page_changed = True
+        st.rerun()
+
+def _nav(page, **state):
+    """Switch to a sub-page, apply any extra session state and rerun at most once"""
+    stale = any(st.session_state.get(key) != value for key, value in state.items())
+    st.session_state.update(state)
+    if stale and st.session_state.get("current_page") == page:
+        # Same page but different state (e.g. another group): still needs a fresh run
+        st.rerun()
+    _maybe_rerun(page)
+
 def load_groups():
     """Load groups from session state or use defaults"""
     if "achievement_groups" not in st.session_state:
-        st.session_state.achievement_groups = DEFAULT_GROUPS.copy()
+        # Copy every group and member so per-session edits never touch the shared defaults
+        st.session_state.achievement_groups = {
+            group_id: {**group, "members": [dict(m) for m in group["members"]]}
+            for group_id, group in _default_groups_frozen().items()
+        }
     return st.session_state.achievement_groups
 
 def save_groups(groups):
-    """Save groups to session state"""
+    """Save groups to session state (skipped when the content is unchanged)"""
+    digest = hashlib.blake2b(pickle.dumps(groups, protocol=5), digest_size=8).digest()
+    if st.session_state.get("_groups_hash") == digest:
+        return
+    st.session_state._groups_hash = digest
     st.session_state.achievement_groups = groups
 
+# Color variants used by a group card, derived once per group
+Palette = namedtuple("Palette", "base bg15 bg05 bg20 border40")
+
+
+def _palette(color):
+    return Palette(color, f"{color}15", f"{color}05", f"{color}20", f"{color}40")
+
+
+# Group card markup, compiled once at import
+_CARD_TPL = string.Template(
+    '<div style="background: linear-gradient(135deg, ${bg15} 0%, ${bg05} 100%); '
+    'border: 2px solid ${color}; border-radius: 15px; padding: 1.5rem; margin: 1rem 0; '
+    'transition: all 0.3s ease; box-shadow: 0 4px 15px rgba(0,0,0,0.1);">'
+    '<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">'
+    '<h3 style="margin: 0; color: ${color}; font-size: 1.3rem;">${name}</h3>'
+    '<div style="background: ${color}; color: white; padding: 0.3rem 0.8rem; border-radius: 20px; '
+    'font-size: 0.8rem; font-weight: bold;">${member_count} members</div>'
+    '</div>'
+    '<p style="margin: 0 0 1rem 0; color: #666; font-size: 0.9rem;">${description}</p>'
+    '<div style="display: flex; flex-wrap: wrap; gap: 0.5rem; margin-bottom: 1rem;">${chips}</div></div>'
+)
+_CHIP_TPL = string.Template(
+    '<div style="background: ${bg20}; border: 1px solid ${border40}; padding: 0.3rem 0.6rem; '
+    'border-radius: 12px; font-size: 0.8rem; color: ${color};">${label}</div>'
+)
+
+
+@st.cache_data(show_spinner=False)
+def _render_group_card_html(group_id, name, palette, description, member_names, total):
+    """Build the full HTML of a group card (header, preview chips and "+N more") as one string
+
+    member_names must already be HTML-escaped (see the ``name_html`` member field).
+    """
+    chip_colors = {"bg20": palette.bg20, "border40": palette.border40, "color": palette.base}
+    labels = list(member_names)
+    if total > 3:
+        labels.append(f"+{total - 3} more")
+    chips_html = "".join(_CHIP_TPL.substitute(chip_colors, label=label) for label in labels)
+
+    return _CARD_TPL.substitute(
+        bg15=palette.bg15,
+        bg05=palette.bg05,
+        color=palette.base,
+        name=_html.escape(name),
+        member_count=total,
+        description=_html.escape(description),
+        chips=chips_html,
+    )
+
 def render_research_groups_page():
     """Render the main research groups page"""
 
-    # Check backend module status (silent)
-    if not backend_available:
-        st.warning("⚠️ Backend module not available. Using mock data mode.")
-
     # Action buttons row
     col_actions1, col_actions2 = st.columns(2)
 
     with col_actions1:
         if st.button("➕ Create New Group", key="create_new_group_unique_test", type="primary", use_container_width=True):
-            st.session_state.current_page = "edit_group"
-            st.session_state.editing_group = None
-            # Force clear any cached state and rerun
-            st.session_state.page_changed = True
-            st.rerun()
+            _nav("edit_group", editing_group=None)
 
     with col_actions2:
         if st.button("📋 View Existing Reports", key="view_existing_reports_unique_test", type="primary", use_container_width=True):
-            st.session_state.current_page = "view_reports"
-            # Force clear any cached state and rerun
-            st.session_state.page_changed = True
-            st.rerun()
+            _maybe_rerun("view_reports")
 
     st.markdown("---")
 
-    # Load and display groups
-    groups = load_groups()
-    
     # Groups grid layout
     st.markdown("### 🎯 Research Groups")
-    
+    _groups_grid()
+
+def _column_plan(num_groups):
+    """Return (column count, column index per group), memoized in session state per group count"""
+    plan_key = f"_cols_plan_{num_groups}"
+    plan = st.session_state.get(plan_key)
+    if plan is None:
+        # Calculate optimal grid layout
+        if num_groups <= 3:
+            ncols = num_groups
+        elif num_groups <= 6:
+            ncols = 3
+        else:
+            ncols = 4
+        plan = (ncols, tuple(i % ncols for i in range(num_groups)))
+        st.session_state[plan_key] = plan
+    return plan
+
+@st.fragment
+def _groups_grid():
+    """Render the group cards; widget interactions here rerun only this fragment"""
+    groups = load_groups()
+    palettes = {gid: _palette(g['color']) for gid, g in groups.items()}
+
     # Create a responsive grid layout
-    group_ids = list(groups.keys())
-    num_groups = len(group_ids)
-    
-    # Calculate optimal grid layout
-    if num_groups <= 3:
-        cols = st.columns(num_groups)
-    elif num_groups <= 6:
-        cols = st.columns(3)
-    else:
-        cols = st.columns(4)
-    
-    for i, group_id in enumerate(group_ids):
-        group_data = groups[group_id]
-        col_idx = i % len(cols)
-        
+    ncols, assignments = _column_plan(len(groups))
+    cols = st.columns(ncols)
+
+    for col_idx, (group_id, group_data) in zip(assignments, groups.items()):
+        members = group_data['members']
+        n = len(members)
+
         with cols[col_idx]:
             # Group card
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, {group_data['color']}15 0%, {group_data['color']}05 100%);
-                border: 2px solid {group_data['color']};
-                border-radius: 15px;
-                padding: 1.5rem;
-                margin: 1rem 0;
-                transition: all 0.3s ease;
-                box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            ">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                    <h3 style="margin: 0; color: {group_data['color']}; font-size: 1.3rem;">{group_data['name']}</h3>
-                    <div style="
-                        background: {group_data['color']};
-                        color: white;
-                        padding: 0.3rem 0.8rem;
-                        border-radius: 20px;
-                        font-size: 0.8rem;
-                        font-weight: bold;
-                    ">
-                        {len(group_data['members'])} members
-                    </div>
-                </div>
-                <p style="margin: 0 0 1rem 0; color: #666; font-size: 0.9rem;">{group_data['description']}</p>
-                <div style="display: flex; flex-wrap: wrap; gap: 0.5rem; margin-bottom: 1rem;">
-            """, unsafe_allow_html=True)
-            
-            # Show first 3 members as preview
-            for member in group_data['members'][:3]:
-                st.markdown(f"""
-                <div style="
-                    background: {group_data['color']}20;
-                    border: 1px solid {group_data['color']}40;
-                    padding: 0.3rem 0.6rem;
-                    border-radius: 12px;
-                    font-size: 0.8rem;
-                    color: {group_data['color']};
-                ">
-                    {member['name']}
-                </div>
-                """, unsafe_allow_html=True)
-            
-            if len(group_data['members']) > 3:
-                st.markdown(f"""
-                <div style="
-                    background: {group_data['color']}20;
-                    border: 1px solid {group_data['color']}40;
-                    padding: 0.3rem 0.6rem;
-                    border-radius: 12px;
-                    font-size: 0.8rem;
-                    color: {group_data['color']};
-                ">
-                    +{len(group_data['members']) - 3} more
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("</div></div>", unsafe_allow_html=True)
-            
+            st.markdown(
+                _render_group_card_html(
+                    group_id,
+                    group_data['name'],
+                    palettes[group_id],
+                    group_data['description'],
+                    tuple(member.get('name_html') or _html.escape(member['name']) for member in islice(members, 3)),
+                    n,
+                ),
+                unsafe_allow_html=True,
+            )
+
             # Action buttons for each group
             col_btn1, col_btn2 = st.columns(2)
             with col_btn1:
                 if st.button("✏️ Edit", key=f"edit_{group_id}", use_container_width=True):
-                    st.session_state.current_page = "edit_group"
-                    st.session_state.editing_group = group_id
-                    st.rerun()
+                    _nav("edit_group", editing_group=group_id)
 
             with col_btn2:
                 if st.button("📊 Generate Report", key=f"report_{group_id}", use_container_width=True):
-                    st.session_state.current_page = "generate_report"
-                    st.session_state.selected_group = group_id
-                    # Force clear any cached state and rerun
-                    st.session_state.page_changed = True
-                    st.rerun()
+                    _nav("generate_report", selected_group=group_id)
+
+_MEMBER_COLUMNS = ["name", "homepage", "affiliation"]
+
+@st.fragment
+def _members_editor():
+    """Render the editable member table; edits rerun only this fragment
+
+    The editor is always fed the member list captured when the page opened
+    (temp_members_base); Streamlit replays the user's edits on top of it and
+    the result is mirrored into temp_members.
+    """
+    import pandas as pd
+
+    edited = st.data_editor(
+        pd.DataFrame(st.session_state.temp_members_base, columns=_MEMBER_COLUMNS),
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        key="members_editor",
+        column_config={
+            "name": st.column_config.TextColumn("👤 Name", help="e.g., John Smith", width="medium"),
+            "homepage": st.column_config.TextColumn("🔗 Homepage (optional)", help="https://example.com/~john", width="medium"),
+            "affiliation": st.column_config.TextColumn(
+                "🏛️ Affiliation (optional)",
+                help="e.g., Ph.D. candidate, Information Science, Cornell University",
+                width="large",
+            ),
+        },
+    )
+
+    # Update member data
+    st.session_state.temp_members = edited.fillna("").to_dict("records")
 
 def render_edit_group_page():
     """Render the edit group page"""
 
     # Back button
     if st.button("← Back to Groups", key="back_to_groups_edit", type="secondary"):
-        st.session_state.current_page = "research_groups"
-        st.session_state.page_changed = True
-        st.rerun()
+        _maybe_rerun("research_groups")
 
     # Page header
     is_edit = st.session_state.get('editing_group') is not None
@@ -291,60 +366,12 @@ def render_edit_group_page():
     
     if "temp_members" not in st.session_state:
         st.session_state.temp_members = group_data.get('members', []).copy()
+        st.session_state.temp_members_base = st.session_state.temp_members.copy()
+        # Start the editor fresh for this group
+        st.session_state.pop("members_editor", None)
     
-    # Display existing members
-    if st.session_state.temp_members:
-        # Add headers for member input fields
-        col_header1, col_header2, col_header3, col_header4 = st.columns([2, 2.5, 3, 1])
-        with col_header1:
-            st.markdown("**👤 Name**")
-        with col_header2:
-            st.markdown("**🔗 Homepage** *(optional)*")
-        with col_header3:
-            st.markdown("**🏛️ Affiliation** *(optional)*")
-        with col_header4:
-            st.markdown("**Action**")
-
-        st.markdown("---")
-
-    for i, member in enumerate(st.session_state.temp_members):
-        st.markdown(f"**Member {i+1}:**")
-        col_member1, col_member2, col_member3, col_member4 = st.columns([2, 2.5, 3, 1])
-
-        with col_member1:
-            member_name = st.text_input("Name", value=member.get('name', ''),
-                                      key=f"member_name_{i}", label_visibility="collapsed",
-                                      placeholder="e.g., John Smith")
-        with col_member2:
-            member_homepage = st.text_input("Homepage", value=member.get('homepage', ''),
-                                          key=f"member_homepage_{i}", label_visibility="collapsed",
-                                          placeholder="https://example.com/~john")
-        with col_member3:
-            member_affiliation = st.text_area("Affiliation", value=member.get('affiliation', ''),
-                                             key=f"member_affiliation_{i}", label_visibility="collapsed",
-                                             placeholder="e.g., Ph.D. candidate, Information Science, Cornell University\nor\nPostdoc at Stanford & Enigma, working with Prof. Andreas Tolias",
-                                             height=60)
-        with col_member4:
-            if st.button("🗑️", key=f"remove_member_{i}", help="Remove member"):
-                st.session_state.temp_members.pop(i)
-                st.rerun()
+    _members_editor()
 
-        # Update member data
-        st.session_state.temp_members[i] = {
-            'name': member_name,
-            'homepage': member_homepage,
-            'affiliation': member_affiliation
-        }
-    
-    # Add new member
-    if st.button("➕ Add Member", key="add_member"):
-        st.session_state.temp_members.append({
-            'name': '',
-            'homepage': '',
-            'affiliation': ''
-        })
-        st.rerun()
-    
     st.markdown("---")
     
     # Action buttons
@@ -368,7 +395,7 @@ def render_edit_group_page():
                     'name': group_name.strip(),
                     'description': group_description.strip(),
                     'color': selected_color,
-                    'members': [m for m in st.session_state.temp_members if m['name'].strip()]
+                    'members': [{**m, 'name_html': _html.escape(m['name'])} for m in st.session_state.temp_members if m['name'].strip()]
                 }
             else:
                 # Generate new ID
@@ -377,21 +404,15 @@ def render_edit_group_page():
                     'name': group_name.strip(),
                     'description': group_description.strip(),
                     'color': selected_color,
-                    'members': [m for m in st.session_state.temp_members if m['name'].strip()]
+                    'members': [{**m, 'name_html': _html.escape(m['name'])} for m in st.session_state.temp_members if m['name'].strip()]
                 }
 
             save_groups(groups)
-            st.session_state.temp_members = []
-            st.session_state.current_page = "research_groups"
-            st.session_state.page_changed = True
-            st.rerun()
+            _nav("research_groups", temp_members=[])
 
     with col_actions2:
         if st.button("❌ Cancel", key="cancel_edit", type="secondary", use_container_width=True):
-            st.session_state.temp_members = []
-            st.session_state.current_page = "research_groups"
-            st.session_state.page_changed = True
-            st.rerun()
+            _nav("research_groups", temp_members=[])
     
     with col_actions3:
         if editing_group_id:
@@ -458,24 +479,30 @@ def render_edit_group_page():
                         st.session_state[delete_confirm_key] = False
                         st.rerun()
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_latest_report_time(storage_group_type):
+    """Newest stored report timestamp for a storage group, read from the report manifest"""
+    return _get_backend().get_latest_achievement_report_time(storage_group_type)
+
 def render_generate_report_page():
     """Render the generate report page"""
 
     # Back button
     if st.button("← Back to Groups", key="back_to_groups_generate", type="secondary"):
-        st.session_state.current_page = "research_groups"
-        st.session_state.page_changed = True
-        st.rerun()
+        _maybe_rerun("research_groups")
     
+    # Check backend module status (silent)
+    backend = _get_backend()
+    if backend is None:
+        st.warning("⚠️ Backend module not available. Using mock data mode.")
+
     # Load groups
     groups = load_groups()
 
     if not groups:
         st.warning("No research groups available. Please create a group first.")
         if st.button("Create Group", key="create_group_fallback"):
-            st.session_state.current_page = "edit_group"
-            st.session_state.page_changed = True
-            st.rerun()
+            _maybe_rerun("edit_group")
         return
 
     # Check if we have a pre-selected group from the group card
@@ -483,6 +510,7 @@ def render_generate_report_page():
     
     if selected_group:
         selected_group_data = groups[selected_group]
+        member_count = len(selected_group_data['members'])
         
         # Display selected group info
         st.markdown(f"""
@@ -495,7 +523,7 @@ def render_generate_report_page():
         ">
             <h4 style="margin: 0 0 1rem 0; color: {selected_group_data['color']};">{selected_group_data['name']}</h4>
             <p style="margin: 0 0 1rem 0;">{selected_group_data['description']}</p>
-            <p style="margin: 0;"><strong>Members:</strong> {len(selected_group_data['members'])}</p>
+            <p style="margin: 0;"><strong>Members:</strong> {member_count}</p>
         </div>
         """, unsafe_allow_html=True)
         
@@ -569,7 +597,7 @@ def render_generate_report_page():
             st.markdown("**Report Summary:**")
             st.info(f"""
             **Group:** {selected_group_data['name']}
-            **Members:** {len(selected_group_data['members'])}
+            **Members:** {member_count}
             **Type:** {report_type}
             **Time Range:** {time_range}
             **Custom Query:** {'Yes' if custom_query.strip() else 'No'}
@@ -588,66 +616,49 @@ def render_generate_report_page():
                 st.stop()
             
             # 🕒 Check for recent reports (within 7 days) before generating new one
-            if backend_available:
+            if backend is not None:
                 try:
                     # Determine storage group type
-                    group_type_mapping = {
-                        "recommend_research_group": "recommend_research_group",
-                        "demo_research_group": "msra_former_interns",  # MSRA former interns
-                        "StartTrack": "starttrack_group"  # 正确的组ID映射
-                    }
-                    storage_group_type = group_type_mapping.get(selected_group, "recommend_research_group")
+                    storage_group_type = _GROUP_TYPE_MAPPING.get(selected_group, "recommend_research_group")
                     
-                    # Load recent reports for this group
-                    recent_reports = load_achievement_reports(storage_group_type)
-                    
-                    # Check if there's a report within the last 7 days
+                    # Check if there's a report within the last 7 days.
+                    # Stored timestamps are ISO-8601, so they compare correctly as strings.
                     from datetime import datetime, timedelta
-                    seven_days_ago = datetime.now() - timedelta(days=7)
+                    cutoff_iso = (datetime.now() - timedelta(days=7)).isoformat()
                     
+                    # The manifest tells us cheaply whether a scan can find anything at all;
+                    # the scan itself streams newest files first and stops at the first hit
                     recent_report = None
-                    for report in recent_reports:
-                        try:
-                            # Parse the creation time
-                            report_time_str = report.get('created_at', '')
-                            if report_time_str:
-                                report_time = datetime.fromisoformat(report_time_str.replace('Z', '+00:00'))
-                                if report_time.replace(tzinfo=None) > seven_days_ago:
-                                    recent_report = report
-                                    break
-                        except Exception as e:
-                            continue  # Skip invalid timestamps
+                    if _get_latest_report_time(storage_group_type).rstrip('Z') > cutoff_iso:
+                        recent_report = next(
+                            (r for r in backend.iter_achievement_reports(storage_group_type)
+                             if r.get('created_at', '').rstrip('Z') > cutoff_iso),
+                            None,
+                        )
                     
                     # If recent report found, automatically use it
                     if recent_report:
-                        report_date = datetime.fromisoformat(recent_report['created_at'].replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M')
+                        report_date = recent_report['created_at'][:16].replace('T', ' ')
                         
                         st.success(f"📅 **使用现有报告** - {report_date} (7天内)")
                         # Automatically navigate to existing report
-                        st.session_state.current_view_report = recent_report['data']
-                        st.session_state.current_page = "view_single_report"
-                        st.session_state.page_changed = True
-                        st.rerun()
+                        _nav("view_single_report", current_view_report=recent_report['data'])
                         
                 except Exception as e:
                     # If checking fails, continue with normal generation
                     st.warning(f"⚠️ 无法检查最近报告: {e}")
                     pass
             
-            with st.spinner("🔄 Generating achievement report..."):
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
+            with st.status("🔄 Generating achievement report...", expanded=True) as status:
                 try:
                     # Real backend path
                     def _on_progress(evt: str, pct: float):
                         try:
-                            status_text.text(f"{evt}…")
-                            progress_bar.progress(int(max(0, min(1.0, pct)) * 100))
+                            status.update(label=f"{evt}… {int(max(0.0, min(1.0, pct)) * 100)}%", state="running")
                         except Exception:
                             pass
 
-                    result = generate_group_achievement_report(
+                    result = backend.generate_group_achievement_report(
                         members=selected_group_data['members'],
                         api_key=(st.session_state.get("llm_api_key", "") or 
                                 st.session_state.get("openai_api_key", "")),
@@ -674,33 +685,178 @@ def render_generate_report_page():
                     st.session_state.stored_reports[report_id] = new_report
                     
                     # ⭐ Save to persistent storage
-                    if backend_available and save_to_history:
+                    if backend is not None and save_to_history:
                         try:
                             # Determine group type based on selected group
-                            group_type_mapping = {
-                                "recommend_research_group": "recommend_research_group",
-                                "demo_research_group": "msra_former_interns",  # MSRA former interns
-                                "StartTrack": "starttrack_group"  # 正确的组ID映射
-                            }
-                            group_type = group_type_mapping.get(selected_group, "recommend_research_group")
+                            group_type = _GROUP_TYPE_MAPPING.get(selected_group, "recommend_research_group")
                             
                             title = f"{selected_group_data['name']}_{report_type}_{time_range}"
-                            saved_path = save_achievement_report(new_report, title, group_type)
+                            saved_path = backend.save_achievement_report(new_report, title, group_type)
+                            _get_latest_report_time.clear()
                             st.success(f"✅ Report saved to: {saved_path}")
                         except Exception as e:
                             st.warning(f"⚠️ Report generated successfully but failed to save to disk: {e}")
                     
-                    st.session_state.current_view_report = new_report
-                    st.session_state.current_page = "view_single_report"
-                    st.session_state.page_changed = True
-                    status_text.text("✅ Report generation complete!")
-                    progress_bar.progress(100)
-                    st.rerun()
+                    status.update(label="✅ Report generation complete!", state="complete")
+                    _nav("view_single_report", current_view_report=_escape_report_html(new_report))
                             
                 except Exception as e:
+                    status.update(label="Report generation failed", state="error")
                     st.error(f"Error during report generation: {e}")
-                    progress_bar.empty()
-                    status_text.empty()
+
+def _created_time_str(created_at):
+    """Format a report's created_at epoch for display ('%Y-%m-%d %H:%M'; now if missing)"""
+    return time.strftime('%Y-%m-%d %H:%M', time.localtime(created_at if created_at is not None else time.time()))
+
+def _escape_report_html(data):
+    """Attach HTML-escaped copies of the strings the People Snapshot renders (in place)"""
+    for m in data.get('individual_reports', []):
+        name = m.get('name', '')
+        m['_name_html'] = _html.escape(name)
+        m['_title_html'] = _html.escape(m.get('header', {}).get('title', ''))
+        m['_initials_html'] = _html.escape(" ".join([p.strip()[:1] for p in (name or " ").split()])[:2].upper())
+    ps = data.get('overall_report', {}).get('people_snapshot')
+    if ps:
+        ps['_clusters_html'] = [_html.escape(c) for c in ps.get('research_topic_clusters', [])]
+        ps['_insts_html'] = [_html.escape(x) for x in ps.get('collaborators_institutions', [])]
+    return data
+
+def _persistent_report_entry(report):
+    """Flatten a stored report file into (report_id, entry) as listed on the reports page"""
+    data = _escape_report_html(report.get('data', {}))
+    report_id = data.get('id', f"persistent_{report.get('filename', '')}")
+    return report_id, {
+        **data,
+        '_group_name_lc': data.get('group_name', '').lower(),
+        '_created_time_str': _created_time_str(data.get('created_at')),
+        'is_persistent': True,
+        'filepath': report.get('filepath', ''),
+        'created_at_str': report.get('created_at', ''),
+        'group_type': report.get('group_type', 'unknown'),
+        'storage_category': report.get('group_type', 'unknown'),
+    }
+
+def _sync_persistent_reports(backend):
+    """Session-cached {report_id: entry} of stored reports, reconciled with disk by delta
+
+    Nothing is touched while the report directories are unchanged; otherwise only
+    files that are new or whose mtime changed are read, and vanished ones dropped.
+    """
+    version = backend.achievement_reports_version()
+    cache = st.session_state.get("_reports_cache")
+    if cache is not None and st.session_state.get("_reports_version") == version:
+        return cache
+
+    if cache is None:
+        cache, index = {}, {}
+    else:
+        index = st.session_state._reports_index  # filepath -> (mtime_ns, report_id)
+
+    current = backend.scan_achievement_reports("all")
+    for path in index.keys() - current.keys():
+        cache.pop(index.pop(path)[1], None)
+    for path, mtime in current.items():
+        seen = index.get(path)
+        if seen is not None:
+            if seen[0] == mtime:
+                continue
+            cache.pop(seen[1], None)
+        try:
+            report = backend.load_achievement_report_file(path)
+        except Exception as e:
+            st.warning(f"Failed to load report {os.path.basename(path)}: {e}")
+            continue
+        report_id, entry = _persistent_report_entry(report)
+        cache[report_id] = entry
+        index[path] = (mtime, report_id)
+
+    st.session_state._reports_cache = cache
+    st.session_state._reports_index = index
+    st.session_state._reports_version = version
+    return cache
+
+# Reports shown per page on the reports list
+REPORTS_PAGE_SIZE = 25
+
+# Report type -> icon shown on the report cards
+_REPORT_TYPE_ICONS = MappingProxyType({
+    "Full report": "📊",
+    "Recent achievements": "🏆",
+    "Publication stats": "📚",
+    "Collaboration network": "🤝",
+    "Demo Report": "🎯"
+})
+
+# Report list card markup, compiled once at import
+_REPORT_CARD_TPL = string.Template("""
+<div style="
+    background: linear-gradient(135deg, #667eea15 0%, #764ba205 100%);
+    border: 2px solid #667eea;
+    border-radius: 15px;
+    padding: 1.5rem;
+    margin: 1rem 0;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    transition: all 0.3s ease;
+">
+    <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 1rem;">
+        <div style="flex: 1;">
+            <h4 style="margin: 0 0 0.5rem 0; color: #667eea; font-size: 1.4rem; font-weight: 600;">
+                ${group_name}
+            </h4>
+            <div style="display: flex; gap: 1rem; align-items: center; flex-wrap: wrap;">
+                <span style="
+                    background: #4facfe;
+                    color: white;
+                    padding: 0.3rem 0.8rem;
+                    border-radius: 20px;
+                    font-size: 0.8rem;
+                    font-weight: bold;
+                ">
+                    👥 ${member_count} members
+                </span>
+                <span style="
+                    background: #28a745;
+                    color: white;
+                    padding: 0.3rem 0.8rem;
+                    border-radius: 20px;
+                    font-size: 0.8rem;
+                    font-weight: 500;
+                ">
+                    📁 ${group_type_label}
+                </span>
+                <span style="
+                    background: #4facfe;
+                    color: white;
+                    padding: 0.3rem 0.8rem;
+                    border-radius: 20px;
+                    font-size: 0.8rem;
+                    font-weight: 500;
+                ">
+                    ${type_icon} ${report_type}
+                </span>
+                <span style="
+                    background: #4facfe;
+                    color: white;
+                    padding: 0.3rem 0.8rem;
+                    border-radius: 20px;
+                    font-size: 0.8rem;
+                    font-weight: 500;
+                ">
+                    ⏰ ${time_range}
+                </span>
+            </div>
+        </div>
+    </div>
+<div style="display: flex; justify-content: space-between; align-items: center; margin-top: 1rem; padding: 0.75rem 1rem; border-top: 1px solid #DAE8F7; background-color: #f9fafb; border-radius: 6px;">
+    <div style="color: #555; font-size: 0.9rem;">
+        <strong style="color:#333;">Created:</strong> ${created_time} <span style="color:#888; font-size:0.9rem;">(${time_ago_text})</span>
+    </div>
+    <div style="color: #666; font-size: 0.9rem;">
+        <strong style="color:#333;">Report ID:</strong> ${report_id}
+    </div>
+</div>
+</div>
+""")
 
 def render_view_reports_page():
     """Render the view reports page with persistent storage support"""
@@ -712,41 +868,51 @@ def render_view_reports_page():
         st.rerun()
     
     # Load reports from persistent storage (all groups)
-    persistent_reports = []
-    if backend_available:
+    persistent_reports = {}
+    backend = _get_backend()
+    if backend is not None:
         try:
-            persistent_reports = load_achievement_reports("all")  # Load from all groups
+            persistent_reports = _sync_persistent_reports(backend)
         except Exception as e:
             st.warning(f"⚠️ Failed to load reports from disk: {e}")
     
     # Get session stored reports (for backward compatibility)
     session_reports = st.session_state.get("stored_reports", {})
     
-    # Combine persistent and session reports (convert to consistent format)
-    all_reports = {}
-    
-    # Add persistent reports
-    for report in persistent_reports:
-        report_id = report.get('data', {}).get('id', f"persistent_{report.get('filename', '')}")
+    # Combine persistent and session reports (convert to consistent format); session
+    # reports are normally persisted too, in which case the persistent dict is used as-is
+    all_reports = persistent_reports
+    missing_ids = session_reports.keys() - persistent_reports.keys()
+    if missing_ids:
+        all_reports = dict(persistent_reports)
+    for report_id in missing_ids:
+        report_data = session_reports[report_id]
         all_reports[report_id] = {
-            **report.get('data', {}),
-            'is_persistent': True,
-            'filepath': report.get('filepath', ''),
-            'created_at_str': report.get('created_at', ''),
-            'group_type': report.get('group_type', 'unknown'),
-            'storage_category': report.get('group_type', 'unknown'),
+            **report_data,
+            '_group_name_lc': report_data.get('group_name', '').lower(),
+            '_created_time_str': _created_time_str(report_data.get('created_at')),
+            'group_type': report_data.get('group_type') or 'session',
+            'is_persistent': False,
         }
     
-    # Add session reports (if not already in persistent storage)
-    for report_id, report_data in session_reports.items():
-        if report_id not in all_reports:
-            all_reports[report_id] = {
-                **report_data,
-                'is_persistent': False,
-            }
-    
     stored_reports = all_reports
 
+    # Newest-first view and per-group counts, rebuilt only when the set of reports changes
+    ctime_key = (st.session_state.get("_reports_version"), tuple(session_reports))
+    if st.session_state.get("_sorted_by_ctime_key") != ctime_key:
+        st.session_state._sorted_by_ctime = sorted(
+            stored_reports.values(), key=lambda x: x.get('created_at', 0), reverse=True
+        )
+        # Anything outside the storage groups is counted as a legacy session report
+        storage_types = set(_GROUP_TYPE_MAPPING.values())
+        st.session_state._report_stats = Counter(
+            r['group_type'] if r.get('group_type') in storage_types else 'session'
+            for r in stored_reports.values()
+        )
+        st.session_state._sorted_by_ctime_key = ctime_key
+    by_ctime = st.session_state._sorted_by_ctime
+    group_stats = st.session_state._report_stats
+
     if not stored_reports:
         st.info("🔍 No reports available. Generate some reports first using the 'Generate Report' button on group cards.")
         if st.button("Go to Groups", key="goto_groups_view_reports"):
@@ -758,21 +924,6 @@ def render_view_reports_page():
     # Statistics and filters
     st.markdown("### 📈 Report Statistics")
 
-    # Group-based statistics
-    group_stats = {
-        "recommend_research_group": 0,
-        "msra_former_interns": 0, 
-        "starttrack_group": 0,
-        "session": 0
-    }
-    
-    for report in stored_reports.values():
-        group_type = report.get('group_type', 'session')
-        if group_type in group_stats:
-            group_stats[group_type] += 1
-        else:
-            group_stats['session'] += 1
-
     stats_col1, stats_col2, stats_col3, stats_col4 = st.columns(4)
 
     with stats_col1:
@@ -792,8 +943,8 @@ def render_view_reports_page():
         st.markdown("**Legacy Session Reports:** " + str(group_stats["session"]))
     
     if stored_reports:
-        latest_report = max(stored_reports.values(), key=lambda x: x.get('created_at', 0))
-        latest_time = time.strftime('%Y-%m-%d', time.localtime(latest_report.get('created_at', time.time())))
+        latest_report = by_ctime[0]
+        latest_time = latest_report['_created_time_str'][:10]
         st.markdown(f"**Latest Report:** {latest_time}")
 
     # # Search and filter options
@@ -815,42 +966,56 @@ def render_view_reports_page():
     #     sort_by = st.selectbox("Sort by:", sort_options, key="report_sort")
 
     # Apply search and sorting (defaults if UI is hidden)
-    filtered_reports = stored_reports.values()
+    filtered_reports = by_ctime
     search_term = st.session_state.get("report_search", "")
     sort_by = st.session_state.get("report_sort", "Newest first")
 
     if search_term:
+        search_term_lc = search_term.lower()
         filtered_reports = [
             report for report in filtered_reports
-            if search_term.lower() in report['group_name'].lower()
+            if search_term_lc in report['_group_name_lc']
         ]
 
-    # Apply sorting
-    if sort_by == "Newest first":
-        sorted_reports = sorted(filtered_reports, key=lambda x: x.get('created_at', 0), reverse=True)
-    elif sort_by == "Oldest first":
-        sorted_reports = sorted(filtered_reports, key=lambda x: x.get('created_at', 0))
-    elif sort_by == "Group name A-Z":
-        sorted_reports = sorted(filtered_reports, key=lambda x: x['group_name'].lower())
-    elif sort_by == "Group name Z-A":
-        sorted_reports = sorted(filtered_reports, key=lambda x: x['group_name'].lower(), reverse=True)
-
     # Display results
     st.markdown("---")
     if search_term or sort_by != "Newest first":
-        st.markdown(f"#### 📊 Available Reports ({len(sorted_reports)} found)")
+        st.markdown(f"#### 📊 Available Reports ({len(filtered_reports)} found)")
     else:
         st.markdown("#### 📊 Available Reports")
 
-    if not sorted_reports:
+    if not filtered_reports:
         st.info("🔍 No reports match your search criteria. Try adjusting your filters.")
 
-    for report in sorted_reports:
+    # Paginate so only one page of cards and action widgets is built per rerun
+    n_pages = max(1, -(-len(filtered_reports) // REPORTS_PAGE_SIZE))
+    if st.session_state.get("report_page", 1) > n_pages:
+        st.session_state.report_page = n_pages
+    page = 1
+    if n_pages > 1:
+        page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, step=1, key="report_page")
+    start, end = (page - 1) * REPORTS_PAGE_SIZE, page * REPORTS_PAGE_SIZE
+
+    # Apply sorting; filtered_reports is already newest first, and the name orders only
+    # need the reports up to the end of the current page
+    if sort_by == "Newest first":
+        page_reports = filtered_reports[start:end]
+    elif sort_by == "Oldest first":
+        page_reports = list(islice(reversed(filtered_reports), start, end))
+    elif sort_by == "Group name A-Z":
+        page_reports = heapq.nsmallest(end, filtered_reports, key=itemgetter('_group_name_lc'))[start:]
+    elif sort_by == "Group name Z-A":
+        page_reports = heapq.nlargest(end, filtered_reports, key=itemgetter('_group_name_lc'))[start:]
+
+    # All cards go out in a single markdown message; only the actions are per-report widgets
+    cards_html = []
+    now = time.time()
+    for report in page_reports:
         # Enhanced report card with more information
-        created_time = time.localtime(report.get('created_at', time.time()))
-        time_ago = time.time() - report.get('created_at', time.time())
+        created_time = report['_created_time_str']
+        time_ago = now - report.get('created_at', now)
 
-        # Calculate time ago
+        # Calculate time ago (the only part that drifts with the clock)
         if time_ago < 3600:  # Less than 1 hour
             time_ago_text = f"{int(time_ago // 60)} minutes ago"
         elif time_ago < 86400:  # Less than 1 day
@@ -858,97 +1023,34 @@ def render_view_reports_page():
         elif time_ago < 604800:  # Less than 1 week
             time_ago_text = f"{int(time_ago // 86400)} days ago"
         else:
-            time_ago_text = time.strftime('%Y-%m-%d', created_time)
-
-        # Get report type icon
-        report_type_icons = {
-            "Full report": "📊",
-            "Recent achievements": "🏆",
-            "Publication stats": "📚",
-            "Collaboration network": "🤝",
-            "Demo Report": "🎯"
-        }
-        type_icon = report_type_icons.get(report['report_type'], "📋")
-
-        report_id = report['id']
-        created_time = time.strftime('%Y-%m-%d %H:%M', created_time)
-        
-        card_html = textwrap.dedent(f"""
-<div style="
-    background: linear-gradient(135deg, #667eea15 0%, #764ba205 100%);
-    border: 2px solid #667eea;
-    border-radius: 15px;
-    padding: 1.5rem;
-    margin: 1rem 0;
-    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    transition: all 0.3s ease;
-">
-    <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 1rem;">
-        <div style="flex: 1;">
-            <h4 style="margin: 0 0 0.5rem 0; color: #667eea; font-size: 1.4rem; font-weight: 600;">
-                {report['group_name']}
-            </h4>
-            <div style="display: flex; gap: 1rem; align-items: center; flex-wrap: wrap;">
-                <span style="
-                    background: #4facfe;
-                    color: white;
-                    padding: 0.3rem 0.8rem;
-                    border-radius: 20px;
-                    font-size: 0.8rem;
-                    font-weight: bold;
-                ">
-                    👥 {len(report.get('members', [])) if 'members' in report else len(report.get('individual_reports', []))} members
-                </span>
-                <span style="
-                    background: #28a745;
-                    color: white;
-                    padding: 0.3rem 0.8rem;
-                    border-radius: 20px;
-                    font-size: 0.8rem;
-                    font-weight: 500;
-                ">
-                    📁 {report.get('group_type', 'session').replace('_', ' ').title()}
-                </span>
-                <span style="
-                    background: #4facfe;
-                    color: white;
-                    padding: 0.3rem 0.8rem;
-                    border-radius: 20px;
-                    font-size: 0.8rem;
-                    font-weight: 500;
-                ">
-                    {type_icon} {report['report_type']}
-                </span>
-                <span style="
-                    background: #4facfe;
-                    color: white;
-                    padding: 0.3rem 0.8rem;
-                    border-radius: 20px;
-                    font-size: 0.8rem;
-                    font-weight: 500;
-                ">
-                    ⏰ {report['time_range']}
-                </span>
-            </div>
-        </div>
-    </div>
-<div style="display: flex; justify-content: space-between; align-items: center; margin-top: 1rem; padding: 0.75rem 1rem; border-top: 1px solid #DAE8F7; background-color: #f9fafb; border-radius: 6px;">
-    <div style="color: #555; font-size: 0.9rem;">
-        <strong style="color:#333;">Created:</strong> {created_time} <span style="color:#888; font-size:0.9rem;">({time_ago_text})</span>
-    </div>
-    <div style="color: #666; font-size: 0.9rem;">
-        <strong style="color:#333;">Report ID:</strong> {report_id}
-    </div>
-</div>
+            time_ago_text = created_time[:10]
+
+        type_icon = _REPORT_TYPE_ICONS.get(report['report_type'], "📋")
+        member_count = len(report.get('members', [])) if 'members' in report else len(report.get('individual_reports', []))
+
+        card_html = _REPORT_CARD_TPL.substitute(
+            group_name=report['group_name'],
+            member_count=member_count,
+            group_type_label=report.get('group_type', 'session').replace('_', ' ').title(),
+            type_icon=type_icon,
+            report_type=report['report_type'],
+            time_range=report['time_range'],
+            created_time=created_time,
+            time_ago_text=time_ago_text,
+            report_id=report['id'],
+        )
+        cards_html.append(card_html)
 
-        """)
-        st.markdown(card_html, unsafe_allow_html=True)
+    if cards_html:
+        st.markdown("\n".join(cards_html), unsafe_allow_html=True)
+        st.markdown("##### Actions")
 
-        # Action buttons for each report
+    for report in page_reports:
+        # Action buttons for each report, labelled so they can be matched to the cards above
         col_view, col_delete = st.columns(2)
 
         with col_view:
-            if st.button("👁️ View Report", key=f"view_{report['id']}", use_container_width=True):
+            if st.button(f"👁️ View Report · {report['group_name']} ({report['id']})", key=f"view_{report['id']}", use_container_width=True):
                 # Set current report for viewing
                 st.session_state.current_view_report = report
                 st.session_state.current_page = "view_single_report"
@@ -972,8 +1074,8 @@ def render_view_reports_page():
                             
                             # Delete from persistent storage if applicable
                             if report.get('is_persistent', False) and report.get('filepath'):
-                                if backend_available:
-                                    delete_success = delete_report(report['filepath'])
+                                if backend is not None:
+                                    delete_success = backend.delete_report(report['filepath'])
                                     if delete_success:
                                         st.success(f"✅ Report '{report['group_name']}' deleted from disk.")
                                     else:
@@ -1015,7 +1117,7 @@ def render_view_single_report_page():
     if is_detailed_report:
         tab_overall, tab_cards = st.tabs(["📊 Overall Report", "👥 Individual Reports"])
         with tab_cards:
-            render_member_cards_like_search(report_data["individual_reports"])
+            render_member_cards_like_search(report_data["individual_reports"], report_data.get("id", ""))
         with tab_overall:
             render_overall_report(report_data["overall_report"], report_data.get("individual_reports", []))
     else:
@@ -1084,11 +1186,17 @@ def render_overall_report(overall_data, individual_reports):
         if "overall_nav" not in st.session_state:
             st.session_state.overall_nav = options[0]
         active = st.session_state.overall_nav
+        # Set the section in the click callback so the button's own rerun already renders it
         for opt in options:
-            if st.button(opt, use_container_width=True, type=("primary" if opt == active else "secondary"), key=f"overall_nav_{opt}"):
-                st.session_state.overall_nav = opt
-                st.rerun()
-        nav = st.session_state.overall_nav
+            st.button(
+                opt,
+                use_container_width=True,
+                type=("primary" if opt == active else "secondary"),
+                key=f"overall_nav_{opt}",
+                on_click=st.session_state.__setitem__,
+                args=("overall_nav", opt),
+            )
+        nav = active
 
     with content_col:
         if nav == "People Snapshot":
@@ -1138,6 +1246,18 @@ def render_overall_report(overall_data, individual_reports):
                     st.markdown(f"- {w}")
 
 
+# Styles for the People Snapshot chips, initials bubbles and member cards; sent once per render
+# so each element only carries its class name
+_PEOPLE_SNAPSHOT_CSS = """<style>
+.ps-chip{display:inline-block;padding:.25rem .6rem;border-radius:9999px;background:#e5edff;border:1px solid #c7d2fe;color:#1e3a8a;font-weight:700;margin:.2rem .35rem .2rem 0}
+.ps-bubble{width:30px;height:30px;border-radius:9999px;background:#e2e8f0;color:#1f2937;display:inline-flex;align-items:center;justify-content:center;margin-right:.35rem;font-weight:700}
+.ps-inst{display:inline-block;padding:.2rem .5rem;border-radius:9999px;border:1px solid #cbd5e1;background:#f8fafc;margin:.2rem .3rem .2rem 0}
+.ps-card{background:#fff;border:1px solid #e5e7eb;border-radius:18px;padding:16px;text-align:center;box-shadow:0 10px 18px rgba(0,0,0,.06);height:350px;display:flex;flex-direction:column;justify-content:center}
+.ps-card-name{font-weight:800;font-size:18px;margin:.2rem 0}
+.ps-card-title{opacity:.8;overflow:hidden;text-overflow:ellipsis}
+</style>"""
+
+
 def _render_people_snapshot(overall_data, individual_reports):
     ps = overall_data.get("people_snapshot", {})
     clusters = ps.get("research_topic_clusters", [])
@@ -1146,16 +1266,21 @@ def _render_people_snapshot(overall_data, individual_reports):
 
     st.markdown("### People Snapshot")
     st.markdown("<div style='font-weight:700;margin:.2rem 0 .3rem 0'>Research Clusters</div>", unsafe_allow_html=True)
-    chip_html = "".join([f"<span style=\"display:inline-block;padding:.25rem .6rem;border-radius:9999px;background:#e5edff;border:1px solid #c7d2fe;color:#1e3a8a;font-weight:700;margin:.2rem .35rem .2rem 0\">{_html.escape(c)}</span>" for c in clusters])
-    st.markdown(f"<div>{chip_html}</div>", unsafe_allow_html=True)
-
-    initials = [" ".join([p.strip()[:1] for p in m.get("name"," ").split()])[:2].upper() for m in individual_reports]
+    clusters_html = ps.get("_clusters_html") or [_html.escape(c) for c in clusters]
+    chip_html = "".join([f"<span class='ps-chip'>{c}</span>" for c in clusters_html])
+    st.markdown(f"{_PEOPLE_SNAPSHOT_CSS}<div>{chip_html}</div>", unsafe_allow_html=True)
+
+    initials = [
+        m.get("_initials_html") or _html.escape(" ".join([p.strip()[:1] for p in m.get("name"," ").split()])[:2].upper())
+        for m in individual_reports
+    ]
     st.markdown(f"<div style='opacity:.8;margin:.4rem 0'>Scale: {size} members</div>", unsafe_allow_html=True)
-    bubble = "".join([f"<span style=\"display:inline-block;width:30px;height:30px;border-radius:9999px;background:#e2e8f0;color:#1f2937;display:inline-flex;align-items:center;justify-content:center;margin-right:.35rem;font-weight:700\">{_html.escape(x)}</span>" for x in initials])
+    bubble = "".join([f"<span class='ps-bubble'>{x}</span>" for x in initials])
     st.markdown(f"<div style='margin-bottom:.6rem'>{bubble}</div>", unsafe_allow_html=True)
 
     st.markdown("<div style='font-weight:700;margin:.6rem 0 .3rem 0'>Representative Collaborators/Institutions</div>", unsafe_allow_html=True)
-    inst_html = "".join([f"<span style=\"display:inline-block;padding:.2rem .5rem;border-radius:9999px;border:1px solid #cbd5e1;background:#f8fafc;margin:.2rem .3rem .2rem 0\">{_html.escape(x)}</span>" for x in insts])
+    insts_html = ps.get("_insts_html") or [_html.escape(x) for x in insts]
+    inst_html = "".join([f"<span class='ps-inst'>{x}</span>" for x in insts_html])
     st.markdown(f"<div>{inst_html}</div>", unsafe_allow_html=True)
 
     st.markdown("<div style='height:.6rem'></div>", unsafe_allow_html=True)
@@ -1164,11 +1289,16 @@ def _render_people_snapshot(overall_data, individual_reports):
         row = individual_reports[start:start+3]
         cols = st.columns(3)
         for i, member in enumerate(row):
+            name_html = member.get('_name_html')
+            if name_html is None:
+                name_html = _html.escape(member.get('name',''))
+            title_html = member.get('_title_html')
+            if title_html is None:
+                title_html = _html.escape(member.get('header',{}).get('title',''))
             with cols[i]:
                 st.markdown(
-                    f"""
-                    <div style=\"background:#fff;border:1px solid #e5e7eb;border-radius:18px;padding:16px;text-align:center;box-shadow:0 10px 18px rgba(0,0,0,.06);height:350px;display:flex;flex-direction:column;justify-content:center\">\n<div style=\"font-weight:800;font-size:18px;margin:.2rem 0\">{_html.escape(member.get('name',''))}</div>\n<div style=\"opacity:.8;overflow:hidden;text-overflow:ellipsis\">{_html.escape(member.get('header',{}).get('title',''))}</div>\n</div>
-                    """,
+                    f"<div class='ps-card'><div class='ps-card-name'>{name_html}</div>"
+                    f"<div class='ps-card-title'>{title_html}</div></div>",
                     unsafe_allow_html=True,
                 )
 
@@ -1239,14 +1369,58 @@ def render_individual_reports_detailed(individual_reports):
                     st.markdown(f"- **{paper['title']}** | {paper['venue']} | {paper['year']} | {paper['links']}")
 
 
-def render_member_cards_like_search(individual_reports):
+# Fields copied into the candidate profile payload by "View Full Profile"
+_REP_KEYS = ("title", "venue", "year", "type", "links")
+_PAYLOAD_LIST_KEYS = ("honors_grants", "service_talks", "open_source_projects", "highlights")
+
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _radar_figure(radar_items):
+    """Plotly radar for one member's radar scores, shared by every member with the same scores"""
+    import plotly.graph_objects as go
+
+    categories = [k for k, _ in radar_items]
+    values = [v for _, v in radar_items]
+    categories_closed = categories + [categories[0]]
+    values_closed = values + [values[0]]
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatterpolar(
+            r=values_closed,
+            theta=categories_closed,
+            fill="toself",
+            name="Profile",
+            line=dict(color="#667eea", width=2),
+            fillcolor="rgba(102, 126, 234, 0.2)",
+        )
+    )
+    fig.update_layout(
+        font=dict(size=13),
+        margin=dict(l=70, r=70, t=40, b=55),
+        polar=dict(
+            domain=dict(x=[0.08, 0.92], y=[0.1, 0.98]),
+            radialaxis=dict(visible=True, range=[0, 5]),
+            bgcolor="rgba(0,0,0,0)",
+        ),
+        showlegend=False,
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+    )
+    return fig
+
+
+def render_member_cards_like_search(individual_reports, report_id=""):
     """Render members using the targeted_search candidate card UI."""
     # Theme
     current_theme = st.context.theme.type or "light"
     text_color = "#f1f5f9" if current_theme == "dark" else "#495057"
 
     for i, member in enumerate(individual_reports, 1):
-        with st.expander(f"#{i} {member['name']}", expanded=True):
+        # Only the first card starts open; the radar is built once its expander is opened
+        expander = st.expander(
+            f"#{i} {member['name']}", expanded=(i == 1), key=f"exp_open_{report_id}_{i}", on_change="rerun"
+        )
+        with expander:
             header = member.get("header", {})
             name = member.get("name", "Unknown")
             role = header.get("title", "N/A")
@@ -1285,34 +1459,9 @@ def render_member_cards_like_search(individual_reports):
 
             with middle_col:
                 if isinstance(radar, dict) and len(radar) > 0:
-                    categories = list(radar.keys())
-                    values = [radar[k] for k in categories]
-                    categories_closed = categories + [categories[0]]
-                    values_closed = values + [values[0]]
-                    fig = go.Figure()
-                    fig.add_trace(
-                        go.Scatterpolar(
-                            r=values_closed,
-                            theta=categories_closed,
-                            fill="toself",
-                            name="Profile",
-                            line=dict(color="#667eea", width=2),
-                            fillcolor="rgba(102, 126, 234, 0.2)",
-                        )
-                    )
-                    fig.update_layout(
-                        font=dict(size=13),
-                        margin=dict(l=70, r=70, t=40, b=55),
-                        polar=dict(
-                            domain=dict(x=[0.08, 0.92], y=[0.1, 0.98]),
-                            radialaxis=dict(visible=True, range=[0, 5]),
-                            bgcolor="rgba(0,0,0,0)",
-                        ),
-                        showlegend=False,
-                        paper_bgcolor="rgba(0,0,0,0)",
-                        plot_bgcolor="rgba(0,0,0,0)",
-                    )
-                    st.plotly_chart(fig, use_container_width=False, key=f"radar_card_{i}")
+                    if expander.open:
+                        fig = _radar_figure(tuple(radar.items()))
+                        st.plotly_chart(fig, use_container_width=False, key=f"radar_card_{i}")
                 else:
                     st.markdown(
                         """
@@ -1343,15 +1492,7 @@ def render_member_cards_like_search(individual_reports):
                     type="primary",
                 ):
                     reps_src = member.get("representative_papers", []) or []
-                    normalized_reps = []
-                    for rp in reps_src:
-                        normalized_reps.append({
-                            "title": rp.get("title", ""),
-                            "venue": rp.get("venue", ""),
-                            "year": rp.get("year", ""),
-                            "type": rp.get("type", ""),
-                            "links": rp.get("links", ""),
-                        })
+                    normalized_reps = [{k: rp.get(k, "") for k in _REP_KEYS} for rp in reps_src]
 
                     profile_payload = {
                         "name": name,
@@ -1363,46 +1504,51 @@ def render_member_cards_like_search(individual_reports):
                         "profiles": profiles,
                         "publication_overview": [],
                         "top_tier_hits": [],
-                        "honors_grants": member.get("honors_grants", []),
-                        "service_talks": member.get("service_talks", []),
-                        "open_source_projects": member.get("open_source_projects", []),
+                        **{k: member.get(k, []) for k in _PAYLOAD_LIST_KEYS},
                         "representative_papers": normalized_reps,
-                        "highlights": member.get("highlights", []),
                         "radar": radar,
                         "total_score": total_score or 0,
                         "detailed_scores": member.get("detailed_scores", {}),
                     }
-                    st.session_state["demo_candidate_overview_json"] = json.dumps(profile_payload)
+                    st.session_state["demo_candidate_overview"] = profile_payload
                     st.session_state["prev_page"] = st.session_state.get("current_page", "📊 Achievement Report")
                     st.session_state.current_page = "🧑 Candidate Profile"
                     st.session_state.page_changed = True
                     st.rerun()
 
 
-def render_focus_and_profiles(research_focus: list, profiles: dict, current_theme: str, text_color: str):
-    # Chips
+# Chip/link colours for render_focus_and_profiles, per theme
+_FOCUS_COLORS = MappingProxyType({
+    "dark": MappingProxyType({"chip_bg": "rgba(59,130,246,.15)", "chip_bd": "rgba(59,130,246,.35)", "chip_fg": "#e5e7eb", "link": "#93c5fd"}),
+    "light": MappingProxyType({"chip_bg": "#eef2ff", "chip_bd": "#c7d2fe", "chip_fg": "#0f172a", "link": "#2563eb"}),
+})
+_PROFILE_LINK_KEYS = ("Homepage", "Google Scholar", "GitHub", "LinkedIn")
+
+
+@st.cache_data(show_spinner=False)
+def _build_focus_html(research_focus, profile_items, current_theme):
+    """Chips for the research focus followed by the profile links, as one HTML string"""
+    colors = _FOCUS_COLORS["dark" if current_theme == "dark" else "light"]
+    parts = []
     if research_focus:
-        if current_theme == "dark":
-            chip_bg = "rgba(59,130,246,.15)"; chip_bd = "rgba(59,130,246,.35)"; chip_fg = "#e5e7eb"
-        else:
-            chip_bg = "#eef2ff"; chip_bd = "#c7d2fe"; chip_fg = "#0f172a"
-        chip_items = []
-        for x in research_focus:
-            chip_items.append(
-                f"<span style=\"display:inline-block;padding:.2rem .6rem;border-radius:9999px;background:{chip_bg};border:1px solid {chip_bd};color:{chip_fg};font-size:.8rem;font-weight:600;margin:.15rem .25rem .15rem 0\">{_html.escape(str(x))}</span>"
-            )
-        chips_html = "".join(chip_items)
-        st.markdown(f"<div style='margin:.2rem 0 .5rem 0'>{chips_html}</div>", unsafe_allow_html=True)
+        chips_html = "".join(
+            f"<span style=\"display:inline-block;padding:.2rem .6rem;border-radius:9999px;background:{colors['chip_bg']};border:1px solid {colors['chip_bd']};color:{colors['chip_fg']};font-size:.8rem;font-weight:600;margin:.15rem .25rem .15rem 0\">{_html.escape(str(x))}</span>"
+            for x in research_focus
+        )
+        parts.append(f"<div style='margin:.2rem 0 .5rem 0'>{chips_html}</div>")
 
-    # Links
-    items = [(k, (profiles or {}).get(k, "").strip()) for k in ["Homepage", "Google Scholar", "GitHub", "LinkedIn"] if (profiles or {}).get(k)]
+    profiles = dict(profile_items)
+    items = [(k, profiles[k].strip()) for k in _PROFILE_LINK_KEYS if profiles.get(k)]
     if items:
-        if current_theme == "dark":
-            link_color = "#93c5fd"; link_hover = "#bfdbfe"
-        else:
-            link_color = "#2563eb"; link_hover = "#1d4ed8"
-        links_html = "".join([f'<li><a href="{u}" target="_blank" style="color:{link_color};text-decoration:none;padding:.2rem .3rem;border-radius:6px;display:inline-flex;gap:.3rem">{p}</a></li>' for p, u in items])
-        st.markdown(f"<ul style='display:grid;grid-template-columns:repeat(auto-fit,minmax(120px,1fr));gap:.3rem .5rem;margin:.2rem 0 .4rem 0;padding:0;list-style:none'>{links_html}</ul>", unsafe_allow_html=True)
+        links_html = "".join([f'<li><a href="{_html.escape(u)}" target="_blank" style="color:{colors["link"]};text-decoration:none;padding:.2rem .3rem;border-radius:6px;display:inline-flex;gap:.3rem">{p}</a></li>' for p, u in items])
+        parts.append(f"<ul style='display:grid;grid-template-columns:repeat(auto-fit,minmax(120px,1fr));gap:.3rem .5rem;margin:.2rem 0 .4rem 0;padding:0;list-style:none'>{links_html}</ul>")
+    return "".join(parts)
+
+
+def render_focus_and_profiles(research_focus: list, profiles: dict, current_theme: str, text_color: str):
+    focus_html = _build_focus_html(tuple(research_focus or ()), tuple(sorted((profiles or {}).items())), current_theme)
+    if focus_html:
+        st.markdown(focus_html, unsafe_allow_html=True)
 
 
 def render_group_summary(report_data):
@@ -1434,6 +1580,16 @@ def render_individual_reports_legacy(members):
                 st.markdown(f"[🔗 Homepage]({member['homepage']})")
             st.markdown(member.get('report', 'No report available'))
 
+# Sub-page name -> renderer for render_achievement_report_page
+_PAGE_RENDERERS = MappingProxyType({
+    "research_groups": render_research_groups_page,
+    "edit_group": render_edit_group_page,
+    "generate_report": render_generate_report_page,
+    "view_reports": render_view_reports_page,
+    "view_single_report": render_view_single_report_page,
+})
+
+
 def render_achievement_report_page():
     """Main function to render the achievement report page with navigation"""
 
@@ -1454,45 +1610,11 @@ def render_achievement_report_page():
         if "temp_members" in st.session_state and st.session_state.current_page != "edit_group":
             del st.session_state.temp_members
 
-    # Get current page and use exact matching
+    # Main navigation entries (e.g. "📊 Achievement Report") and unknown pages land on the groups page
     current_page = st.session_state.get('current_page', '')
-    
-    # Use exact string matching for pages
-    if current_page == "research_groups":
-        target_page = "research_groups"
-    elif current_page == "edit_group":
-        target_page = "edit_group"
-    elif current_page == "generate_report":
-        target_page = "generate_report"
-    elif current_page == "view_reports":
-        target_page = "view_reports"
-    elif current_page == "view_single_report":
-        target_page = "view_single_report"
-    else:
-        # For main navigation pages, map them to sub-pages
-        if current_page == "📊 Achievement Report":
-            target_page = "research_groups"
-            st.session_state.current_page = "research_groups"
-        else:
-            # Fallback: reset to research groups page
-            st.session_state.current_page = "research_groups"
-            target_page = "research_groups"
-
-    # Navigation logic with proper state management
-    if target_page == "research_groups":
-        render_research_groups_page()
-    elif target_page == "edit_group":
-        render_edit_group_page()
-    elif target_page == "generate_report":
-        render_generate_report_page()
-    elif target_page == "view_reports":
-        render_view_reports_page()
-    elif target_page == "view_single_report":
-        render_view_single_report_page()
-    else:
-        # Fallback: reset to research groups page
-        st.session_state.current_page = "research_groups"
-        render_research_groups_page()
+    if current_page not in _PAGE_RENDERERS:
+        current_page = st.session_state.current_page = "research_groups"
+    _PAGE_RENDERERS[current_page]()
 
 def apply_achievement_report_styles():
     """Apply custom CSS for achievement report page"""
@@ -1,4 +1,4 @@
-import json
+import functools
 import html
 import re
 import streamlit as st
@@ -9,9 +9,8 @@ from .targeted_search import render_research_focus, render_profiles
 
 
 
-def apply_candidate_profile_styles():
-    st.markdown(
-        """
+# Shared styles for the candidate profile layout
+_PROFILE_CSS = """
 <style>
 .profile-wrap { display: grid; grid-template-columns: 1.1fr 1.4fr; gap: 1rem; }
 @media (max-width: 1100px) { .profile-wrap { grid-template-columns: 1fr; } }
@@ -27,20 +26,22 @@ def apply_candidate_profile_styles():
 .stMarkdown p, .stMarkdown li { overflow-wrap:anywhere; word-break:break-word; }
 .stMarkdown a { word-break: break-all; }
 </style>
-        """,
-        unsafe_allow_html=True,
-    )
+"""
+
+
+def apply_candidate_profile_styles():
+    # Re-emitted on every run: Streamlit drops elements a rerun does not send again
+    st.markdown(_PROFILE_CSS, unsafe_allow_html=True)
 
 
 def _get_theme_text_color():
     return "#e5e7eb" if st.get_option("theme.base") == "dark" else "#111827"
 
 
-def _render_radar(radar: dict, text_color: str):
-    if not radar:
-        return
-    categories = list(radar.keys())
-    values = [radar[k] for k in categories]
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _build_radar_figure(radar_items: tuple, text_color: str) -> go.Figure:
+    categories = [k for k, _ in radar_items]
+    values = [v for _, v in radar_items]
     categories_closed = categories + [categories[0]]
     values_closed = values + [values[0]]
     fig = go.Figure()
@@ -64,14 +65,49 @@ def _render_radar(radar: dict, text_color: str):
         paper_bgcolor="rgba(0,0,0,0)",
         plot_bgcolor="rgba(0,0,0,0)",
     )
+    return fig
+
+
+def _render_radar(radar: dict, text_color: str):
+    if not radar:
+        return
+    fig = _build_radar_figure(tuple(radar.items()), text_color)
     st.plotly_chart(fig, use_container_width=True, config={"displaylogo": False})
 
 
-def _linkify(text: str) -> str:
+_URL_RE = re.compile(r"https?://[^\s<>\"']+")
+
+
+def _linkify(text) -> str:
     """Escape text but convert URLs to clickable anchors.
     Keeps wrapping intact via CSS set on parent container.
     """
-    return text
+    return _linkify_str(str(text))
+
+
+@functools.lru_cache(maxsize=1024)
+def _linkify_str(text: str) -> str:
+    # 先在原始文本上匹配 URL，再分别转义普通片段与 URL，避免实体进入 href
+    parts = []
+    pos = 0
+    for m in _URL_RE.finditer(text):
+        url = html.escape(m.group(0))
+        parts.append(html.escape(text[pos:m.start()]))
+        parts.append(f'<a href="{url}" target="_blank">{url}</a>')
+        pos = m.end()
+    parts.append(html.escape(text[pos:]))
+    return "".join(parts)
+
+
+def _bulleted_html(items, title: str) -> str:
+    """Panel title plus its items as one HTML list (markdown heading kept for the title)"""
+    return f"#### {title}\n\n<ul>" + "".join(f"<li>{_linkify(x)}</li>" for x in items) + "</ul>"
+
+
+def _emit_bulleted(items, title: str):
+    """Emit a whole bulleted panel as a single markdown message"""
+    st.markdown(_bulleted_html(items, title), unsafe_allow_html=True)
+
 
 def render_candidate_profile_page(candidate_data: dict | None = None, include_back_button: bool = True):
     apply_candidate_profile_styles()
@@ -79,9 +115,9 @@ def render_candidate_profile_page(candidate_data: dict | None = None, include_ba
     # Check if we have any candidate data
     data: dict
     if not candidate_data:
-        demo_str = st.session_state.get("demo_candidate_overview_json")
-        if demo_str:
-            data = json.loads(demo_str)
+        demo = st.session_state.get("demo_candidate_overview")
+        if demo:
+            data = demo
         else:
             # No candidate data available, show error message
             st.error("❌ No candidate data available to display.")
@@ -139,70 +175,53 @@ def render_candidate_profile_page(candidate_data: dict | None = None, include_ba
     with right:
         if data.get("highlights"):
             with st.container(border=True):
-                st.markdown("#### Highlights")
-                highs = data.get("highlights", [])
-                if highs:
-                    st.markdown("\n".join([f"- {_linkify(x)}" for x in highs]), unsafe_allow_html=True)
-                else:
-                    st.caption("No highlights")
+                _emit_bulleted(data.get("highlights", []), "Highlights")
 
         if data.get("publication_overview"):
             with st.container(border=True):
-                st.markdown("#### Publication Overview")
-                pubs = data.get("publication_overview", [])
-                if pubs:
-                    st.markdown("\n".join([f"- {_linkify(x)}" for x in pubs]), unsafe_allow_html=True)
+                parts = [_bulleted_html(data.get("publication_overview", []), "Publication Overview")]
                 hits = data.get("top_tier_hits", [])
                 if hits:
-                    st.markdown("<div class=divider></div>", unsafe_allow_html=True)
-                    st.markdown("**Acceptances (last 24 months):** " + ", ".join([_linkify(x) for x in hits]), unsafe_allow_html=True)
+                    parts.append("<div class=divider></div>")
+                    parts.append("**Acceptances (last 24 months):** " + ", ".join([_linkify(x) for x in hits]))
+                st.markdown("\n\n".join(parts), unsafe_allow_html=True)
         if data.get("honors_grants"):
             with st.container(border=True):
-                st.markdown("#### Honors/Funding")
-                honors = data.get("honors_grants", [])
-                if honors:
-                    st.markdown("\n".join([f"- {_linkify(x)}" for x in honors]), unsafe_allow_html=True)
+                _emit_bulleted(data.get("honors_grants", []), "Honors/Funding")
 
         if data.get("service_talks"):
             with st.container(border=True):
-                st.markdown("#### Academic Service/Invited Talks")
-                svc = data.get("service_talks", [])
-                if svc:
-                    st.markdown("\n".join([f"- {_linkify(x)}" for x in svc]), unsafe_allow_html=True)
-                else:
-                    st.caption("No service records")
+                _emit_bulleted(data.get("service_talks", []), "Academic Service/Invited Talks")
 
         if data.get("open_source_projects"):
             with st.container(border=True):
-                st.markdown("#### Open Source/Datasets/Projects")
                 proj = data.get("open_source_projects")
                 if isinstance(proj, list):
-                    st.markdown("\n".join([f"- {_linkify(x)}" for x in proj]), unsafe_allow_html=True)
+                    _emit_bulleted(proj, "Open Source/Datasets/Projects")
                 elif isinstance(proj, str) and proj.strip():
-                    st.markdown(_linkify(proj), unsafe_allow_html=True)
+                    st.markdown(f"#### Open Source/Datasets/Projects\n\n{_linkify(proj)}", unsafe_allow_html=True)
         if data.get("representative_papers"):
             with st.container(border=True):
-                st.markdown("#### Representative Papers")
-                reps = data.get("representative_papers", [])
-                for item in reps or []:
+                rep_items = []
+                for item in data.get("representative_papers", []) or []:
                     title = item.get("title", "")
                     venue = item.get("venue", "")
                     year = item.get("year", "")
                     links = item.get("links", "")
-                    
+                    entry = f"{html.escape(title)} — {html.escape(venue)} {html.escape(str(year))}"
                     if links:
-                        st.markdown("- " + f"{html.escape(title)} — {html.escape(venue)} {html.escape(str(year))} ({_linkify(links)})", unsafe_allow_html=True)
-                    else:
-                        st.markdown("- " + f"{html.escape(title)} — {html.escape(venue)} {html.escape(str(year))}", unsafe_allow_html=True)
-                
+                        entry += f" ({_linkify(str(links))})"
+                    rep_items.append(f"<li>{entry}</li>")
+                parts = ["#### Representative Papers", f"<ul>{''.join(rep_items)}</ul>"]
+
                 # Display trigger paper below representative papers
                 trigger_title = data.get("trigger_paper_title", "")
                 trigger_url = data.get("trigger_paper_url", "")
                 if trigger_title:
-                    st.markdown("---")
-                    st.markdown("**Paper that led to this candidate discovery:**")
+                    parts.append("---")
+                    parts.append("**Paper that led to this candidate discovery:**")
                     if trigger_url:
-                        st.markdown(f"- {html.escape(trigger_title)} ([Link]({trigger_url}))", unsafe_allow_html=True)
+                        parts.append(f"- {html.escape(trigger_title)} ([Link]({trigger_url}))")
                     else:
-                        st.markdown(f"- {html.escape(trigger_title)}", unsafe_allow_html=True)
-
+                        parts.append(f"- {html.escape(trigger_title)}")
+                st.markdown("\n\n".join(parts), unsafe_allow_html=True)
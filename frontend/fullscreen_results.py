@@ -1,6 +1,5 @@
 # pyright: reportMissingImports=false
 import streamlit as st
-import json
 import pandas as pd
 from pathlib import Path
 import sys
@@ -452,8 +451,8 @@ def render_fullscreen_results_page():
                             "detailed_scores": cdict.get("Detailed Scores", {}),
                         }
 
-                        # Store JSON string for candidate_profile page to consume
-                        st.session_state["demo_candidate_overview_json"] = json.dumps(profile_payload)
+                        # Store the payload for the candidate_profile page to consume
+                        st.session_state["demo_candidate_overview"] = profile_payload
                         # Remember previous page for back navigation
                         st.session_state["prev_page"] = st.session_state.get("current_page", "🔍 Full Screen Results")
                         # Navigate to subpage and rerun
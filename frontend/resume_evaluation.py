@@ -629,7 +629,7 @@ def render_resume_evaluation_page() -> None:
 
                 # Store for candidate profile subpage
                 st.session_state["candidate_overview"] = profile_payload
-                st.session_state["demo_candidate_overview_json"] = json.dumps(profile_payload)
+                st.session_state["demo_candidate_overview"] = profile_payload
 
                 # Minimal container data for this page’s legacy visuals
                 st.session_state["resume_eval_v2"] = {
@@ -846,7 +846,7 @@ def _display_candidate_card(candidate, index, current_theme, text_color):
                         "detailed_scores": cdict.get("Detailed Scores", {}),
                     }
                     
-                    st.session_state["demo_candidate_overview_json"] = json.dumps(profile_payload)
+                    st.session_state["demo_candidate_overview"] = profile_payload
                     st.session_state["prev_page"] = st.session_state.get("current_page", "🔍 人才搜索")
                     st.session_state.current_page = "🧑 Candidate Profile"
                     st.session_state.page_changed = True